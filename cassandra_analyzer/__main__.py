@@ -7,6 +7,7 @@ import yaml
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 import structlog
 
 from .analyzer import CassandraAnalyzer
@@ -17,11 +18,13 @@ logger = structlog.get_logger()
 
 
 @click.command()
-@click.option("--config", type=click.Path(exists=True), required=True, help="Configuration file path (required)")
+@click.option("--config", type=click.Path(exists=True), help="Configuration file path (required unless --batch is used)")
 @click.option("--output-dir", default="./reports", help="Output directory for reports")
 @click.option("--verbose", is_flag=True, help="Enable verbose logging")
 @click.option("--pdf", is_flag=True, help="Also generate PDF report (requires WeasyPrint, not available in executables)")
-def main(config, output_dir, verbose, pdf):
+@click.option("--batch", type=click.Path(exists=True, file_okay=False), help="Convert every markdown report in this directory to PDF and exit (PDFs go to --output-dir if given, else next to each report)")
+@click.pass_context
+def main(ctx, config, output_dir, verbose, pdf, batch):
     """
     Analyze a Cassandra cluster using AxonOps API data
     """
@@ -56,6 +59,19 @@ def main(config, output_dir, verbose, pdf):
         cache_logger_on_first_use=True,
     )
     
+    if batch:
+        if config or pdf:
+            raise click.UsageError("--batch cannot be combined with --config or --pdf.")
+        # The default output directory only applies to analysis reports
+        batch_output_dir = None
+        if ctx.get_parameter_source("output_dir") is not click.core.ParameterSource.DEFAULT:
+            batch_output_dir = Path(output_dir)
+        _generate_pdf_batch(Path(batch), batch_output_dir)
+        return
+    
+    if not config:
+        raise click.UsageError("Missing option '--config'.")
+    
     # Load configuration
     click.echo(f"Loading configuration from: {config}")
     with open(config, 'r') as f:
@@ -132,5 +148,42 @@ def main(config, output_dir, verbose, pdf):
         raise click.ClickException(str(e))
 
 
+def _generate_pdf_batch(directory: Path, output_dir: Optional[Path] = None):
+    """Convert all markdown reports in a directory to PDF with a single generator
+    
+    A report that fails to convert is reported and skipped; the command exits
+    non-zero once the remaining reports have been converted.
+    """
+    from .reports.pdf_generator import PDFGenerator
+    
+    markdown_files = sorted(directory.glob("*.md"))
+    if not markdown_files:
+        click.echo(f"No markdown reports found in: {directory}")
+        return
+    
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # One generator for all files so WeasyPrint, fonts and the stylesheet are loaded once
+    pdf_generator = PDFGenerator()
+    failed = []
+    for markdown_path in markdown_files:
+        pdf_path = output_dir / markdown_path.with_suffix('.pdf').name if output_dir else None
+        try:
+            pdf_path = pdf_generator.generate_pdf(markdown_path, pdf_path)
+        except ImportError as e:
+            # Missing PDF dependencies affect every report, so stop here
+            raise click.ClickException(str(e))
+        except Exception as e:
+            logger.error("PDF generation failed", markdown_file=str(markdown_path), error=str(e))
+            click.echo(f"Error: failed to convert {markdown_path}: {e}", err=True)
+            failed.append(markdown_path)
+            continue
+        click.echo(f"PDF report saved to: {pdf_path}")
+    
+    if failed:
+        raise click.ClickException(f"{len(failed)} of {len(markdown_files)} reports could not be converted to PDF")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,20 +2,46 @@
 Enhanced report generator for analysis results
 """
 
+import ipaddress
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 import structlog
 from ..models.recommendations import Severity
 
-# Make PDF generation optional
-try:
-    from .pdf_generator import PDFGenerator
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# PDF generation is optional; its heavy dependencies are only imported when used
+from .pdf_generator import PDFGenerator, PDF_AVAILABLE
+
+# Detail keys checked (in order) for the appendix "Current Value" column.
+# The optional second element restricts a key to issues whose title contains it.
+_VALUE_KEY_PRIORITY = (
+    ("memtable_allocation_type", None),
+    ("memtable_flush_writers", None),
+    ("concurrent_reads", "Low Concurrent Reads"),
+    ("concurrent_writes", "Low Concurrent Writes"),
+    ("native_transport_max_threads", None),
+    ("sysctl_value", None),
+    ("current_value", None),
+)
+
+
+# Rendered by {{ br }} at the end of a template line; the only trailing
+# whitespace _clean_empty_lines keeps, as a two-space markdown line break
+_HARD_BREAK = "\x00"
+
+# Node Details keys holding an address that an IP seed can match
+_NODE_ADDRESS_KEYS = ("listen_address", "comp_listen_address", "host_Hostname")
+
+
+def _is_ip_address(value: str) -> bool:
+    """Check if a seed or hostname is an IPv4/IPv6 address rather than a name"""
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
 
 
 class EnhancedReportGenerator:
@@ -29,8 +55,12 @@ class EnhancedReportGenerator:
         template_dir = Path(__file__).parent / "templates"
         self.env = Environment(
             loader=FileSystemLoader(str(template_dir)),
-            autoescape=False  # Disable autoescape for markdown output
+            autoescape=False,  # Disable autoescape for markdown output
+            auto_reload=False,
+            cache_size=-1
         )
+        self.env.globals["br"] = _HARD_BREAK
+        self._template = None
         
         # Register custom filters
         self.env.filters['format_number'] = self._format_number
@@ -63,7 +93,7 @@ class EnhancedReportGenerator:
         # Generate PDF if requested
         if generate_pdf:
             if not PDF_AVAILABLE:
-                structlog.get_logger().warning("PDF generation requested but dependencies not installed. Install with: pip install weasyprint markdown beautifulsoup4")
+                structlog.get_logger().warning("PDF generation requested but dependencies not installed. Install with: pip install weasyprint markdown")
             else:
                 try:
                     pdf_generator = PDFGenerator()
@@ -77,6 +107,8 @@ class EnhancedReportGenerator:
     
     def _generate_enhanced_markdown(self, report_data: Dict[str, Any], output_path: Path):
         """Generate enhanced markdown report"""
+        cluster_state = report_data["cluster_state"]
+        
         # Aggregate recommendations to avoid repetition
         aggregated_results = {}
         node_details = {}  # Store node-specific details for appendix
@@ -97,6 +129,9 @@ class EnhancedReportGenerator:
             
             # Collect node details for appendix
             for agg_rec in aggregated_recs:
+                address = self._resolve_node_address(cluster_state, agg_rec["context"].get("node_id"))
+                agg_rec["node_display"] = f"{address[0]}/{address[1]}" if address else "Cluster-wide"
+                
                 if agg_rec.get("affected_nodes"):
                     issue_key = f"{section_name}:{agg_rec['title']}"
                     node_details[issue_key] = {
@@ -105,22 +140,27 @@ class EnhancedReportGenerator:
                         "affected_nodes": agg_rec["affected_nodes"]
                     }
         
+        self._prepare_node_details(node_details, cluster_state)
+        
         # Process recommendations to group by priority
         recommendations_by_priority = self._group_recommendations_by_priority(aggregated_results)
         
         # Calculate statistics
         stats = self._calculate_statistics(report_data)
+        seed_node_ids = self._find_seed_node_ids(cluster_state)
         
         # Prepare context for template
         context = {
             "cluster_info": report_data["cluster_info"],
-            "cluster_state": report_data["cluster_state"],
+            "cluster_state": cluster_state,
             "analysis_results": aggregated_results,
             "generation_time": datetime.utcnow().isoformat(),
             "recommendations_by_priority": recommendations_by_priority,
             "stats": stats,
             "sections": self._prepare_sections(aggregated_results),
-            "node_details": node_details  # Add node details for appendix
+            "node_details": node_details,  # Add node details for appendix
+            "seed_node_ids": seed_node_ids,
+            "node_table_body": self._prepare_appendix(cluster_state, seed_node_ids)
         }
         
         # Render template
@@ -138,6 +178,92 @@ class EnhancedReportGenerator:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(report_data, f, indent=2, default=str)
     
+    def _prepare_node_details(self, node_details: Dict[str, Any], cluster_state: Any):
+        """Resolve hostname/IP and current value for every affected node once for the appendix rows"""
+        for details in node_details.values():
+            for node_info in details["affected_nodes"]:
+                node_info["current_value_display"] = self._resolve_current_value(
+                    node_info["details"], details["title"]
+                )
+                address = self._resolve_node_address(cluster_state, node_info["node_id"])
+                if address:
+                    node_info["hostname"], node_info["ip"] = address
+                else:
+                    node_info["hostname"] = "unknown"
+                    node_info["ip"] = node_info["node_id"][:8] + "..."
+    
+    def _prepare_appendix(self, cluster_state: Any, seed_node_ids: Set[str]) -> str:
+        """Build the rows of the appendix node table as a single markdown string"""
+        node_list = []
+        for node_id, node in cluster_state.nodes.items():
+            details = node.Details
+            rack = node.rack if node.rack else "default"
+            ip = details.get("listen_address", details.get("comp_listen_address", node_id[:8] + "..."))
+            node_list.append({
+                "dc": node.DC if node.DC else "Unknown",
+                "rack": rack,
+                "hostname": details.get("host_Hostname", "unknown"),
+                "ip": ip,
+                "version": details.get("comp_releaseVersion", details.get("release_version", "Unknown")),
+                "seed": "✅ Yes" if node_id in seed_node_ids else "❌ No",
+                "status": "✅ Active" if node.is_active else "🔴 Down",
+                "sort_key": node.DC + "||" + rack + "||" + details.get(
+                    "listen_address", details.get("comp_listen_address", details.get("host_Hostname", node_id))
+                ),
+            })
+        
+        # Jinja's sort filter is case-insensitive; keep the same ordering
+        node_list.sort(key=lambda n: n["sort_key"].lower())
+        rows = [
+            "| {dc} | {rack} | {hostname}/{ip} | {version} | {seed} | {status} |".format(**n)
+            for n in node_list
+        ]
+        return "\n".join(rows)
+    
+    def _find_seed_node_ids(self, cluster_state: Any) -> Set[str]:
+        """Get the IDs of all seed nodes in the cluster"""
+        seeds = [seed.lower() for seed in self._extract_seed_hostnames(cluster_state) if seed]
+        seed_ips = {seed for seed in seeds if _is_ip_address(seed)}
+        # Hostname seeds match ignoring case and domain ('host5' == 'HOST5.example.com')
+        seed_bases = {seed.split(".")[0] for seed in seeds if seed not in seed_ips}
+        return {
+            node_id for node_id, node in cluster_state.nodes.items()
+            if self._is_seed_node(node.Details, seed_ips, seed_bases)
+        }
+    
+    def _extract_seed_hostnames(self, cluster_state: Any) -> List[str]:
+        """Get seed hostnames (without ports) from the first node reporting a seed provider"""
+        for node in cluster_state.nodes.values():
+            seed_provider = node.Details.get("comp_seed_provider", "")
+            if seed_provider and "seeds=" in seed_provider:
+                seeds_part = seed_provider.split("seeds=")[1].split("}")[0]
+                return [seed.strip().split(":")[0] for seed in seeds_part.split(",")]
+        return []
+    
+    def _is_seed_node(self, details: Dict[str, Any], seed_ips: Set[str], seed_bases: Set[str]) -> bool:
+        """Check if a node is a seed by its listen address or by its hostname"""
+        if any(details.get(key) in seed_ips for key in _NODE_ADDRESS_KEYS):
+            return True
+        hostname = details.get("host_Hostname", "").lower()
+        return bool(hostname) and not _is_ip_address(hostname) and hostname.split(".")[0] in seed_bases
+    
+    def _resolve_current_value(self, details: Dict[str, Any], title: str) -> Any:
+        """Pick the most relevant current value from a node's recommendation details"""
+        for key, required_title in _VALUE_KEY_PRIORITY:
+            if key in details and (required_title is None or required_title in title):
+                return details[key]
+        return "N/A"
+    
+    def _resolve_node_address(self, cluster_state: Any, node_id: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Get (hostname, ip) for a node, or None if the node is not part of the cluster state"""
+        node = cluster_state.nodes.get(node_id) if node_id else None
+        if not node:
+            return None
+        
+        hostname = node.Details.get("host_Hostname", "unknown")
+        ip = node.Details.get("listen_address", node.Details.get("comp_listen_address", node_id[:8] + "..."))
+        return hostname, ip
+    
     def _group_recommendations_by_priority(self, analysis_results: Dict[str, Any]) -> Dict[str, List[Dict]]:
         """Group recommendations by priority level"""
         grouped = {
@@ -483,21 +609,29 @@ class EnhancedReportGenerator:
         # Clean up empty lines around horizontal rules
         content = re.sub(r'\n\s*\n---\n\s*\n', '\n\n---\n\n', content)
         
-        # Remove trailing whitespace on each line
+        # Remove trailing whitespace on each line, then turn the template's
+        # {{ br }} markers into two-space markdown line breaks
         content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
+        content = re.sub(r'[ \t]*' + _HARD_BREAK + r'$', '  ', content, flags=re.MULTILINE)
         
         # Ensure file ends with single newline
         content = content.rstrip() + '\n'
         
         return content
     
-    def _get_enhanced_markdown_template(self) -> str:
-        """Get the enhanced markdown template"""
-        return self.env.from_string("""
+    def _get_enhanced_markdown_template(self):
+        """Get the compiled enhanced markdown template (compiled once per generator)"""
+        if self._template is None:
+            self._template = self.env.from_string(self._get_enhanced_markdown_source())
+        return self._template
+    
+    def _get_enhanced_markdown_source(self) -> str:
+        """Get the enhanced markdown template source"""
+        return """
 # Cassandra Cluster Health Assessment
 
-**Cluster:** {{ cluster_info.cluster_name }}  
-**Organization:** {{ cluster_info.organization }}  
+**Cluster:** {{ cluster_info.cluster_name }}{{ br }}
+**Organization:** {{ cluster_info.organization }}{{ br }}
 **Generated:** {{ generation_time }}
 
 ---
@@ -508,8 +642,9 @@ class EnhancedReportGenerator:
 ### 🔴 **Critical Issues Detected**
 
 Your cluster has **{{ stats.critical_count }} critical issue(s)** requiring immediate attention. Critical issues indicate:
+
 - Severe misconfigurations that could lead to failures
-- Resource constraints that may cause node instability  
+- Resource constraints that may cause node instability
 - Configuration conflicts preventing proper cluster operation
 
 **Action Required:** Review critical issues below and implement fixes as soon as possible.
@@ -518,6 +653,7 @@ Your cluster has **{{ stats.critical_count }} critical issue(s)** requiring imme
 ### 🟡 **Performance Optimization Needed**
 
 Your cluster has **{{ stats.warning_count }} warning(s)** that should be addressed for optimal performance. While not immediately critical, these can lead to:
+
 - Reduced performance and higher latencies
 - Increased operational costs
 - Risk of escalation to critical issues
@@ -591,39 +727,10 @@ Your Cassandra cluster consists of {{ cluster_state.get_total_nodes() if cluster
 {% set dc_rack_counts = {} %}
 {% set dc_seed_counts = {} %}
 {% set dc_versions = {} %}
-{# First extract all seed hostnames from seed provider #}
-{% set all_seed_hostnames = [] %}
-{% for node_id, temp_node in cluster_state.nodes.items() %}
-  {% set seed_provider = temp_node.Details.get('comp_seed_provider', '') %}
-  {% if seed_provider and 'seeds=' in seed_provider and not all_seed_hostnames %}
-    {% set seeds_part = seed_provider.split('seeds=')[1].split('}')[0] %}
-    {% for seed in seeds_part.split(',') %}
-      {# Remove port number from seed hostname #}
-      {% set seed_host = seed.strip().split(':')[0] %}
-      {% set _ = all_seed_hostnames.append(seed_host) %}
-    {% endfor %}
-  {% endif %}
-{% endfor %}
 {% for node_id, node in cluster_state.nodes.items() %}
   {% set dc = node.DC if node.DC else 'Unknown' %}
   {% set rack = node.rack if node.rack else 'default' %}
-  {% set node_hostname = node.Details.get('host_Hostname', '') %}
-  {# Check if node is a seed - handle domain mismatches #}
-  {% set is_seed = false %}
-  {% if node_hostname %}
-    {% if node_hostname in all_seed_hostnames %}
-      {% set is_seed = true %}
-    {% else %}
-      {# Check for hostname match ignoring domain #}
-      {% set node_base = node_hostname.split('.')[0] if '.' in node_hostname else node_hostname %}
-      {% for seed in all_seed_hostnames if not is_seed %}
-        {% set seed_base = seed.split('.')[0] if '.' in seed else seed %}
-        {% if node_base == seed_base %}
-          {% set is_seed = true %}
-        {% endif %}
-      {% endfor %}
-    {% endif %}
-  {% endif %}
+  {% set is_seed = node_id in seed_node_ids %}
   {% set version = node.Details.get('comp_releaseVersion', node.Details.get('release_version', 'Unknown')) %}
   
   {# Count nodes per DC/rack #}
@@ -737,6 +844,7 @@ _Unable to complete {{ section.title }} analysis. This may indicate missing perm
 {% endfor %}
 {% if batch_warnings %}
 † **Important Note about Batch Activity Detection**: The AxonOps histogram API detects batch-related activity patterns, but individual batch warning log entries may not be retrievable through the logs search API. This is a known limitation. To verify batch warnings:
+
 - Check your Cassandra system.log files directly for "Batch" warnings
 - Monitor batch size metrics: `batch_size_warn_threshold_in_kb` and `batch_size_fail_threshold_in_kb` in cassandra.yaml
 - Use nodetool to check batch performance metrics
@@ -771,7 +879,7 @@ _All extended configuration settings are found in **cassandra.yaml** unless othe
 
 | Parameter | Node/Cluster | Current Value | Recommended | Impact |
 |-----------|--------------|---------------|-------------|---------|
-{% for rec in section.data.recommendations %}{% set node_id = rec.context.get('node_id') %}{% if node_id and cluster_state.nodes.get(node_id) %}{% set node = cluster_state.nodes.get(node_id) %}{% set node_display = node.Details.get('host_Hostname', 'unknown') + '/' + node.Details.get('listen_address', node.Details.get('comp_listen_address', node_id[:8] + '...')) %}{% else %}{% set node_display = 'Cluster-wide' %}{% endif %}| {{ rec | get_attr('title', 'Unknown Parameter') }} | {{ node_display }} | {{ rec | get_attr('current_value', 'N/A') }} | {{ rec.context.get('recommended_value', rec | get_attr('recommendation', 'See details')) }} | {{ rec | get_attr('severity') | severity_text }} |
+{% for rec in section.data.recommendations %}| {{ rec | get_attr('title', 'Unknown Parameter') }} | {{ rec.node_display }} | {{ rec | get_attr('current_value', 'N/A') }} | {{ rec.context.get('recommended_value', rec | get_attr('recommendation', 'See details')) }} | {{ rec | get_attr('severity') | severity_text }} |
 {% endfor %}
 
 {% elif section.name == 'datamodel' %}
@@ -819,7 +927,7 @@ _Security settings are configured in **cassandra.yaml** unless otherwise noted._
 {% for rec in section.data.recommendations %}
 ### {{ rec | get_attr('title', 'Unknown Issue') }}
 
-**Current State:** {{ rec | get_attr('current_value', 'See details below') }}  
+**Current State:** {{ rec | get_attr('current_value', 'See details below') }}{{ br }}
 **Severity:** {{ rec | get_attr('severity') | severity_icon }} {{ rec | get_attr('severity') | severity_text }}
 {% if rec.context.get('config_location') %}
 **Configuration Location:** {{ rec.context.get('config_location') }}
@@ -886,14 +994,14 @@ _**Noted for reference**: Even with no issues detected, regularly review securit
 
 ### Key Terms
 
-**Node**: A single server running Cassandra  
-**Datacenter**: Logical grouping of nodes (often geographic)  
-**Keyspace**: Top-level data container (like a database)  
-**Replication Factor (RF)**: Number of data copies across nodes  
-**Consistency Level**: How many nodes must respond to queries  
-**Compaction**: Process of merging and cleaning data files  
-**Tombstone**: Marker indicating deleted data  
-**Partition**: Unit of data distribution across nodes  
+**Node**: A single server running Cassandra{{ br }}
+**Datacenter**: Logical grouping of nodes (often geographic){{ br }}
+**Keyspace**: Top-level data container (like a database){{ br }}
+**Replication Factor (RF)**: Number of data copies across nodes{{ br }}
+**Consistency Level**: How many nodes must respond to queries{{ br }}
+**Compaction**: Process of merging and cleaning data files{{ br }}
+**Tombstone**: Marker indicating deleted data{{ br }}
+**Partition**: Unit of data distribution across nodes{{ br }}
 
 ## Appendix: Cluster Node Details
 
@@ -902,56 +1010,9 @@ _**Noted for reference**: Even with no issues detected, regularly review securit
 This section provides a detailed view of all nodes in the cluster.
 
 {% if cluster_state.nodes %}
-{# Prepare node details with all information #}
-{# First extract all seed hostnames #}
-{% set all_seed_hostnames = [] %}
-{% for node_id, temp_node in cluster_state.nodes.items() %}
-  {% set seed_provider = temp_node.Details.get('comp_seed_provider', '') %}
-  {% if seed_provider and 'seeds=' in seed_provider and not all_seed_hostnames %}
-    {% set seeds_part = seed_provider.split('seeds=')[1].split('}')[0] %}
-    {% for seed in seeds_part.split(',') %}
-      {# Remove port number from seed hostname #}
-      {% set seed_host = seed.strip().split(':')[0] %}
-      {% set _ = all_seed_hostnames.append(seed_host) %}
-    {% endfor %}
-  {% endif %}
-{% endfor %}
-{% set node_list = [] %}
-{% for node_id, node in cluster_state.nodes.items() %}
-  {% set node_hostname = node.Details.get('host_Hostname', '') %}
-  {# Check if node is a seed - handle domain mismatches #}
-  {% set is_seed = false %}
-  {% if node_hostname %}
-    {% if node_hostname in all_seed_hostnames %}
-      {% set is_seed = true %}
-    {% else %}
-      {# Check for hostname match ignoring domain #}
-      {% set node_base = node_hostname.split('.')[0] if '.' in node_hostname else node_hostname %}
-      {% for seed in all_seed_hostnames if not is_seed %}
-        {% set seed_base = seed.split('.')[0] if '.' in seed else seed %}
-        {% if node_base == seed_base %}
-          {% set is_seed = true %}
-        {% endif %}
-      {% endfor %}
-    {% endif %}
-  {% endif %}
-  {% set node_info = {
-    'dc': node.DC if node.DC else 'Unknown',
-    'rack': node.rack if node.rack else 'default',
-    'hostname': node.Details.get('host_Hostname', 'unknown'),
-    'ip': node.Details.get('listen_address', node.Details.get('comp_listen_address', node_id[:8] + '...')),
-    'version': node.Details.get('comp_releaseVersion', node.Details.get('release_version', 'Unknown')),
-    'is_seed': is_seed,
-    'is_active': node.is_active,
-    'sort_key': node.DC + '||' + (node.rack if node.rack else 'default') + '||' + node.Details.get('listen_address', node.Details.get('comp_listen_address', node.Details.get('host_Hostname', node_id)))
-  } %}
-  {% set _ = node_list.append(node_info) %}
-{% endfor %}
-
 | Datacenter | Rack | Node | Version | Seed | Status |
 |------------|------|------|---------|------|--------|
-{% for node_info in node_list | sort(attribute='sort_key') %}| {{ node_info.dc }} | {{ node_info.rack }} | {{ node_info.hostname }}/{{ node_info.ip }} | {{ node_info.version }} | {{ '✅ Yes' if node_info.is_seed else '❌ No' }} | {{ '✅ Active' if node_info.is_active else '🔴 Down' }} |
-{% endfor %}
+{{ node_table_body }}
 {% endif %}
 
 {% if node_details %}
@@ -961,7 +1022,7 @@ This section provides detailed information about which nodes are affected by eac
 
 {% for issue_key, details in node_details.items() %}
 ### {{ details.title }}
-**Section:** {{ details.section.replace('_', ' ').title() }}  
+**Section:** {{ details.section.replace('_', ' ').title() }}{{ br }}
 **Affected Nodes:** {{ details.affected_nodes | length }}
 {% set config_location = details.affected_nodes[0].details.get('config_location', 'cassandra.yaml') if details.affected_nodes else 'cassandra.yaml' %}
 {% if '(' in details.title and ')' in details.title %}
@@ -977,12 +1038,12 @@ This section provides detailed information about which nodes are affected by eac
 {% if has_config_location %}
 | Node | Current Value | Recommended |
 |------|---------------|-------------|
-{% for node_info in details.affected_nodes %}{% set node = cluster_state.nodes.get(node_info.node_id) %}| {{ node.Details.get('host_Hostname', 'unknown') if node else 'unknown' }}/{{ node.Details.get('listen_address', node.Details.get('comp_listen_address', node_info.node_id[:8] + '...')) if node else node_info.node_id[:8] + '...' }} | {% if 'memtable_allocation_type' in node_info.details %}{{ node_info.details.get('memtable_allocation_type', 'N/A') }}{% elif 'memtable_flush_writers' in node_info.details %}{{ node_info.details.get('memtable_flush_writers', 'N/A') }}{% elif 'concurrent_reads' in node_info.details and 'Low Concurrent Reads' in details.title %}{{ node_info.details.get('concurrent_reads', 'N/A') }}{% elif 'concurrent_writes' in node_info.details and 'Low Concurrent Writes' in details.title %}{{ node_info.details.get('concurrent_writes', 'N/A') }}{% elif 'native_transport_max_threads' in node_info.details %}{{ node_info.details.get('native_transport_max_threads', 'N/A') }}{% elif 'sysctl_value' in node_info.details %}{{ node_info.details.get('sysctl_value', 'N/A') }}{% else %}{{ node_info.details.get('current_value', 'N/A') }}{% endif %} | {{ node_info.details.get('recommended_value', 'See recommendation') }} |
+{% for node_info in details.affected_nodes %}| {{ node_info.hostname }}/{{ node_info.ip }} | {{ node_info.current_value_display }} | {{ node_info.details.get('recommended_value', 'See recommendation') }} |
 {% endfor %}
 {% else %}
 | Node | Details |
 |------|---------|
-{% for node_info in details.affected_nodes %}{% set node = cluster_state.nodes.get(node_info.node_id) %}| {{ node.Details.get('host_Hostname', 'unknown') if node else 'unknown' }}/{{ node.Details.get('listen_address', node.Details.get('comp_listen_address', node_info.node_id[:8] + '...')) if node else node_info.node_id[:8] + '...' }} | {% for key, value in node_info.details.items() if key not in ['node_id', 'component'] and value %}{{ key.replace('comp_', '') }}: {{ value }}{% if not loop.last %}, {% endif %}{% endfor %} |
+{% for node_info in details.affected_nodes %}| {{ node_info.hostname }}/{{ node_info.ip }} | {% for key, value in node_info.details.items() if key not in ['node_id', 'component'] and value %}{{ key.replace('comp_', '') }}: {{ value }}{% if not loop.last %}, {% endif %}{% endfor %} |
 {% endfor %}
 {% endif %}
 
@@ -1083,22 +1144,25 @@ The following configuration parameters have different values across nodes:
 ### Common Issues Explained
 
 **Large Partitions**: When too much data accumulates under one partition key, causing:
+
 - Slow queries as entire partition must be read
 - Memory pressure on nodes
 - Uneven data distribution
 
 **Tombstone Accumulation**: Deleted data markers that:
+
 - Must be scanned during reads
 - Slow down queries significantly
 - Eventually removed by compaction
 
 **GC Pauses**: Java garbage collection freezing the application to free memory:
+
 - Short pauses (< 200ms) are normal
 - Long pauses (> 1s) impact performance
 - Caused by heap pressure or poor tuning
 
 ---
 
-_Report generated by Cassandra AxonOps Analyzer v1.0_  
+_Report generated by Cassandra AxonOps Analyzer v1.0_{{ br }}
 _Analysis completed in {{ cluster_state.collection_duration_seconds | round(2) if cluster_state.collection_duration_seconds else 'N/A' }} seconds_
-""")
\ No newline at end of file
+"""
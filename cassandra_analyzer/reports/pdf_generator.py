@@ -2,195 +2,56 @@
 PDF generator for converting markdown reports to PDF
 """
 
+import html
+import importlib.util
 import os
+import re
+import xml.etree.ElementTree as etree
 from pathlib import Path
 from typing import Optional
 import structlog
 
-try:
-    import markdown
-    from weasyprint import HTML, CSS
-    from weasyprint.text.fonts import FontConfiguration
-    from bs4 import BeautifulSoup
-    PDF_AVAILABLE = True
-except ImportError as e:
-    PDF_AVAILABLE = False
-    # Don't raise immediately - let the user know when they try to use it
-    _pdf_import_error = e
+# WeasyPrint takes seconds to import, so only check that the PDF dependencies are
+# installed here; they are imported on first use by PDFGenerator
+PDF_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ("markdown", "weasyprint"))
 
 logger = structlog.get_logger()
 
-
-class PDFGenerator:
-    """Generates PDF reports from markdown files"""
-    
-    def __init__(self):
-        self.pdf_available = PDF_AVAILABLE
-        if PDF_AVAILABLE:
-            self.font_config = FontConfiguration()
-        else:
-            self.font_config = None
-        
-    def generate_pdf(self, markdown_path: Path, pdf_path: Optional[Path] = None) -> Path:
-        """
-        Convert a markdown file to PDF
-        
-        Args:
-            markdown_path: Path to the markdown file
-            pdf_path: Optional path for the PDF output. If not provided, 
-                     uses the same name as markdown with .pdf extension
-                     
-        Returns:
-            Path to the generated PDF file
-        """
-        if not self.pdf_available:
-            import sys
-            if getattr(sys, 'frozen', False):
-                # Running in a PyInstaller bundle
-                raise ImportError(
-                    "PDF generation is not available in standalone executables. "
-                    "Please use the markdown output or run from source with WeasyPrint installed. "
-                    "See: https://github.com/axonops/cassandra-analyzer#pdf-generation"
-                )
-            else:
-                # Running from source
-                raise ImportError(
-                    "PDF generation dependencies not installed. "
-                    "Install with: pip install weasyprint markdown beautifulsoup4"
-                ) from _pdf_import_error
-        
-        if not markdown_path.exists():
-            raise FileNotFoundError(f"Markdown file not found: {markdown_path}")
-            
-        # Determine output path
-        if pdf_path is None:
-            pdf_path = markdown_path.with_suffix('.pdf')
-            
-        logger.info("Generating PDF from markdown", 
-                   markdown_file=str(markdown_path),
-                   pdf_file=str(pdf_path))
-        
-        # Read markdown content
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
-            
-        # Convert markdown to HTML
-        md = markdown.Markdown(extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br',
-            'markdown.extensions.sane_lists',
-            'markdown.extensions.smarty'
-        ])
-        
-        html_content = md.convert(markdown_content)
-        
-        # Post-process HTML to handle special elements
-        html_content = self._post_process_html(html_content)
-        
-        # Wrap in complete HTML document with styling
-        full_html = self._create_html_document(html_content)
-        
-        # Generate PDF
-        css = CSS(string=self._get_css_styles(), font_config=self.font_config)
-        
-        HTML(string=full_html, base_url=str(markdown_path.parent)).write_pdf(
-            pdf_path,
-            stylesheets=[css],
-            font_config=self.font_config
-        )
-        
-        logger.info("PDF generated successfully", 
-                   pdf_file=str(pdf_path),
-                   size_bytes=pdf_path.stat().st_size)
-        
-        return pdf_path
-    
-    def _post_process_html(self, html: str) -> str:
-        """Post-process HTML to handle special markdown elements"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Handle emoji characters by replacing with text equivalents
-        emoji_replacements = {
-            '🔴': '[CRITICAL]',
-            '🟡': '[WARNING]',
-            '🔵': '[INFO]',
-            '✅': '[OK]',
-            '❌': '[NO]',
-            '⚠️': '[ALERT]',
-            '⚪': '[N/A]',
-            '🖥️': '[INFRASTRUCTURE]',
-            '⚙️': '[CONFIGURATION]',
-            '📊': '[OPERATIONS]',
-            '📐': '[DATA MODEL]',
-            '🔐': '[SECURITY]',
-            '🔧': '[EXTENDED CONFIG]',
-            '❓': '[UNKNOWN]'
-        }
-        
-        # Replace emojis in text
-        for element in soup.find_all(text=True):
-            if element.parent.name not in ['script', 'style']:
-                text = str(element)
-                for emoji, replacement in emoji_replacements.items():
-                    text = text.replace(emoji, replacement)
-                element.replace_with(text)
-        
-        # Process tables to add classes for better styling
-        for table in soup.find_all('table'):
-            # Count columns
-            first_row = table.find('tr')
-            if first_row:
-                col_count = len(first_row.find_all(['th', 'td']))
-                if col_count >= 8:
-                    table['class'] = table.get('class', []) + ['very-wide-table']
-                elif col_count >= 6:
-                    table['class'] = table.get('class', []) + ['wide-table']
-                    
-            # Check if table contains schema definitions (CQL)
-            for cell in table.find_all('td'):
-                if cell.find('code') and 'CREATE TABLE' in cell.get_text():
-                    table['class'] = table.get('class', []) + ['schema-table']
-                    # Break long schema definitions into multiple lines
-                    for code in cell.find_all('code'):
-                        text = code.get_text()
-                        if len(text) > 100:
-                            # Add line breaks after commas in CREATE TABLE statements
-                            formatted_text = text.replace(', ', ',\n    ')
-                            formatted_text = formatted_text.replace('(', '(\n    ')
-                            formatted_text = formatted_text.replace(')', '\n)')
-                            code.string = formatted_text
-        
-        return str(soup)
-    
-    def _create_html_document(self, content: str) -> str:
-        """Create a complete HTML document with the content"""
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Cassandra Cluster Analysis Report</title>
-</head>
-<body>
-    <div class="container">
-        {content}
-    </div>
-</body>
-</html>
-"""
-    
-    def _get_css_styles(self) -> str:
-        """Get CSS styles for the PDF"""
-        return """
+# Emoji characters are replaced with text equivalents in the markdown source
+# since PDF fonts rarely include them
+_EMOJI_REPLACEMENTS = {
+    '🔴': '[CRITICAL]',
+    '🟡': '[WARNING]',
+    '🔵': '[INFO]',
+    '✅': '[OK]',
+    '❌': '[NO]',
+    '⚠️': '[ALERT]',
+    '⚪': '[N/A]',
+    '🖥️': '[INFRASTRUCTURE]',
+    '⚙️': '[CONFIGURATION]',
+    '📊': '[OPERATIONS]',
+    '📐': '[DATA MODEL]',
+    '🔐': '[SECURITY]',
+    '🔧': '[EXTENDED CONFIG]',
+    '❓': '[UNKNOWN]'
+}
+
+# Single-codepoint emojis go through one str.translate pass; the ones carrying a
+# variation selector (e.g. '⚠️') need a plain replace
+_EMOJI_TABLE = str.maketrans({e: r for e, r in _EMOJI_REPLACEMENTS.items() if len(e) == 1})
+_MULTI_CODEPOINT_EMOJIS = tuple((e, r) for e, r in _EMOJI_REPLACEMENTS.items() if len(e) > 1)
+# Matches the first codepoint of any replaceable emoji, so text without emojis is
+# returned untouched after a single scan
+_EMOJI_RE = re.compile('[' + re.escape(''.join(sorted({e[0] for e in _EMOJI_REPLACEMENTS}))) + ']')
+
+# Stylesheet for the PDF, parsed once per generator by WeasyPrint
+_PDF_CSS = """
 /* Base styles */
 @page {
     size: A4 landscape;
     margin: 1.5cm;
     @top-right {
-        content: "Page " counter(page) " of " counter(pages);
+        content: "Page " counter(page);
         font-size: 10pt;
         color: #666;
     }
@@ -208,7 +69,7 @@ h1:first-of-type {
 }
 
 body {
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    font-family: sans-serif;
     font-size: 11pt;
     line-height: 1.6;
     color: #333;
@@ -282,7 +143,7 @@ li {
     margin-bottom: 4pt;
 }
 
-/* Tables */
+/* Tables - column widths come from the <colgroup> added during conversion */
 table {
     width: 100%;
     border-collapse: collapse;
@@ -309,9 +170,7 @@ td {
     border: 1px solid #dee2e6;
     word-wrap: break-word;
     overflow-wrap: break-word;
-    word-break: break-word;
     vertical-align: top;
-    max-width: 0;
 }
 
 tr:nth-child(even) {
@@ -321,32 +180,9 @@ tr:nth-child(even) {
 /* Special handling for wide content in tables */
 td code, th code {
     font-size: 8pt;
-    word-break: break-all;
-}
-
-/* Column width hints for common table types */
-table th:first-child,
-table td:first-child {
-    width: 20%;
-    min-width: 80pt;
-}
-
-/* For tables with many columns, use smaller font */
-table:has(th:nth-child(6)) {
-    font-size: 8pt;
-}
-
-table:has(th:nth-child(8)) {
-    font-size: 7pt;
-}
-
-/* Schema tables need special handling */
-table td:has(> code:only-child) {
-    font-family: "Consolas", "Monaco", monospace;
-    font-size: 7pt;
 }
 
-/* Wide table handling */
+/* Wide table handling - classes assigned by column count during conversion */
 .wide-table {
     font-size: 8pt;
 }
@@ -355,14 +191,12 @@ table td:has(> code:only-child) {
     font-size: 7pt;
 }
 
-.schema-table {
-    table-layout: auto;
-}
-
+/* Schema tables need special handling; only their long CQL needs arbitrary breaks */
 .schema-table td {
     white-space: pre-wrap;
     font-family: "Consolas", "Monaco", monospace;
     font-size: 7pt;
+    word-break: break-all;
 }
 
 /* Code blocks */
@@ -385,7 +219,6 @@ code {
     border-radius: 2pt;
     font-family: "Consolas", "Monaco", "Courier New", monospace;
     font-size: 8pt;
-    word-break: break-all;
 }
 
 /* Horizontal rules */
@@ -447,4 +280,223 @@ h3 + p,
 h4 + p {
     page-break-before: avoid;
 }
-"""
\ No newline at end of file
+"""
+
+# Static document shell around the converted markdown. WeasyPrint only accepts
+# markup, so the body is joined in once and parsed a single time.
+_HTML_DOCUMENT_START = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Cassandra Cluster Analysis Report</title>
+</head>
+<body>
+    <div class="container">
+        """
+_HTML_DOCUMENT_END = """
+    </div>
+</body>
+</html>
+"""
+
+
+
+class _TableClassTreeprocessor:
+    """Markdown tree processor adding width/schema classes to tables for styling"""
+    
+    def run(self, root):
+        for table in root.iter('table'):
+            classes = []
+            
+            # Count columns
+            first_row = next(table.iter('tr'), None)
+            if first_row is not None:
+                col_count = sum(1 for cell in first_row if cell.tag in ('th', 'td'))
+                if col_count >= 8:
+                    classes.append('very-wide-table')
+                elif col_count >= 6:
+                    classes.append('wide-table')
+                if col_count > 1:
+                    table.insert(0, self._build_colgroup(col_count))
+            
+            # Check if table contains schema definitions (CQL)
+            for cell in table.iter('td'):
+                codes = list(cell.iter('code'))
+                if codes and 'CREATE TABLE' in ''.join(cell.itertext()):
+                    if 'schema-table' not in classes:
+                        classes.append('schema-table')
+                    # Break long schema definitions into multiple lines
+                    for code in codes:
+                        text = code.text or ''
+                        # Inline code text is already HTML-escaped at this point
+                        if len(html.unescape(text)) > 100:
+                            # Add line breaks after commas in CREATE TABLE statements
+                            formatted_text = text.replace(', ', ',\n    ')
+                            formatted_text = formatted_text.replace('(', '(\n    ')
+                            formatted_text = formatted_text.replace(')', '\n)')
+                            code.text = formatted_text
+            
+            if classes:
+                table.set('class', ' '.join(classes))
+    
+    def _build_colgroup(self, col_count: int):
+        """Explicit column widths: 20% for the first (label) column, the rest shared evenly"""
+        colgroup = etree.Element('colgroup')
+        etree.SubElement(colgroup, 'col', style='width: 20%')
+        other_width = f"{80 / (col_count - 1):.4g}%"
+        for _ in range(col_count - 1):
+            etree.SubElement(colgroup, 'col', style=f'width: {other_width}')
+        return colgroup
+
+
+class PDFGenerator:
+    """Generates PDF reports from markdown files"""
+    
+    # PDF libraries, imported on first use and shared by all generators
+    _markdown = None
+    _HTML = None
+    _CSS = None
+    _FontConfiguration = None
+    
+    def __init__(self, hard_line_breaks: bool = False, smart_typography: bool = False):
+        """
+        Args:
+            hard_line_breaks: Treat every newline inside a paragraph as a line break
+                (nl2br). Reports mark their line breaks explicitly, so this is off by default.
+            smart_typography: Convert quotes and dashes to typographic forms (smarty)
+        """
+        self.pdf_available = PDF_AVAILABLE
+        self.hard_line_breaks = hard_line_breaks
+        self.smart_typography = smart_typography
+        self.font_config = None
+        self._md = None
+        self._css = None
+    
+    @classmethod
+    def _import_dependencies(cls):
+        """Import the PDF libraries once and cache them on the class"""
+        if cls._HTML is None:
+            import markdown
+            from weasyprint import HTML, CSS
+            from weasyprint.text.fonts import FontConfiguration
+            cls._markdown = markdown
+            cls._CSS = CSS
+            cls._FontConfiguration = FontConfiguration
+            cls._HTML = HTML
+    
+    def _prepare_renderer(self):
+        """Set up fonts, the markdown converter and the stylesheet on first use"""
+        try:
+            self._import_dependencies()
+        except (ImportError, OSError) as e:
+            # WeasyPrint raises OSError when its system libraries (Pango) are missing
+            self._raise_missing_dependencies(e)
+        
+        if self._md is None:
+            self.font_config = self._FontConfiguration()
+            # Build the converter and stylesheet once; extension loading and
+            # CSS parsing are reused for every document this generator renders
+            extensions = [
+                'markdown.extensions.tables',
+                'markdown.extensions.fenced_code',
+                'markdown.extensions.codehilite',
+                'markdown.extensions.toc',
+                'markdown.extensions.sane_lists',
+            ]
+            # Both run regex passes over every paragraph, so only load them on request
+            if self.hard_line_breaks:
+                extensions.append('markdown.extensions.nl2br')
+            if self.smart_typography:
+                extensions.append('markdown.extensions.smarty')
+            self._md = self._markdown.Markdown(extensions=extensions)
+            # Runs after inline and smarty processing (priorities 20 and 2) so inline
+            # <code> elements exist and rewritten code text is not typographically altered
+            self._md.treeprocessors.register(_TableClassTreeprocessor(), 'table_class', 1)
+            self._css = self._CSS(string=_PDF_CSS, font_config=self.font_config)
+    
+    def _raise_missing_dependencies(self, cause: Optional[BaseException] = None):
+        """Raise an ImportError explaining how to get PDF support"""
+        import sys
+        if getattr(sys, 'frozen', False):
+            # Running in a PyInstaller bundle
+            raise ImportError(
+                "PDF generation is not available in standalone executables. "
+                "Please use the markdown output or run from source with WeasyPrint installed. "
+                "See: https://github.com/axonops/cassandra-analyzer#pdf-generation"
+            ) from cause
+        else:
+            # Running from source
+            raise ImportError(
+                "PDF generation dependencies not installed. "
+                "Install with: pip install weasyprint markdown"
+            ) from cause
+        
+    def generate_pdf(self, markdown_path: Path, pdf_path: Optional[Path] = None) -> Path:
+        """
+        Convert a markdown file to PDF
+        
+        Args:
+            markdown_path: Path to the markdown file
+            pdf_path: Optional path for the PDF output. If not provided, 
+                     uses the same name as markdown with .pdf extension
+                     
+        Returns:
+            Path to the generated PDF file
+        """
+        if not self.pdf_available:
+            self._raise_missing_dependencies()
+        
+        if not markdown_path.exists():
+            raise FileNotFoundError(f"Markdown file not found: {markdown_path}")
+        
+        self._prepare_renderer()
+            
+        # Determine output path
+        if pdf_path is None:
+            pdf_path = markdown_path.with_suffix('.pdf')
+            
+        logger.info("Generating PDF from markdown", 
+                   markdown_file=str(markdown_path),
+                   pdf_file=str(pdf_path))
+        
+        # Read markdown content
+        markdown_content = markdown_path.read_text(encoding='utf-8')
+        
+        # Replace emojis before conversion so the HTML never needs a text-node pass
+        markdown_content = self._replace_emojis(markdown_content)
+            
+        # Convert markdown to HTML
+        self._md.reset()
+        html_content = self._md.convert(markdown_content)
+        # Release the source before layout, which is where peak memory is reached
+        del markdown_content
+        
+        # Wrap in complete HTML document with styling
+        full_html = self._create_html_document(html_content)
+        del html_content
+        
+        # Generate PDF
+        self._HTML(string=full_html, base_url=str(markdown_path.parent)).write_pdf(
+            pdf_path,
+            stylesheets=[self._css],
+            font_config=self.font_config
+        )
+        
+        logger.info("PDF generated successfully", 
+                   pdf_file=str(pdf_path),
+                   size_bytes=pdf_path.stat().st_size)
+        
+        return pdf_path
+    
+    def _replace_emojis(self, text: str) -> str:
+        """Replace emoji characters with their text equivalents"""
+        if _EMOJI_RE.search(text) is None:
+            return text
+        for emoji, replacement in _MULTI_CODEPOINT_EMOJIS:
+            text = text.replace(emoji, replacement)
+        return text.translate(_EMOJI_TABLE)
+    
+    def _create_html_document(self, content: str) -> str:
+        """Create a complete HTML document with the content"""
+        return "".join((_HTML_DOCUMENT_START, content, _HTML_DOCUMENT_END))
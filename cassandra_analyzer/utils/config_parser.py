@@ -6,6 +6,43 @@ from typing import Dict, Any, Optional, List
 import re
 
 
+# Details key prefix -> (config section, characters to strip from the key).
+# Cassandra settings lose their "comp_" prefix; JVM and agent keys keep theirs.
+_PREFIX_MAP = {
+    "comp": ("cassandra", 5),
+    "jvm": ("jvm", 0),
+    "agent": ("agent", 0),
+}
+
+_SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([KMGT]i?B)$")
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhd])$")
+
+_BOOLEANS = {"true": True, "false": False}
+
+# Characters other than digits and whitespace that float() accepts at the start
+# of a value: signs, a leading decimal point, and "inf"/"infinity"/"nan"
+_FLOAT_LEAD_CHARS = frozenset("+-.iInN")
+
+_SIZE_UNITS = {
+    "B": 1,
+    "KB": 1024,
+    "KiB": 1024,
+    "MB": 1024 * 1024,
+    "MiB": 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+    "GiB": 1024 * 1024 * 1024,
+    "TB": 1024 * 1024 * 1024 * 1024,
+    "TiB": 1024 * 1024 * 1024 * 1024,
+}
+
+_DURATION_UNITS = {
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+}
+
+
 def parse_node_config(details: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse node configuration from the Details field
@@ -23,20 +60,16 @@ def parse_node_config(details: Dict[str, Any]) -> Dict[str, Any]:
         "agent": {}
     }
     
+    system = config["system"]
     for key, value in details.items():
-        if key.startswith("comp_"):
-            # Cassandra configuration
-            config_key = key[5:]  # Remove "comp_" prefix
-            config["cassandra"][config_key] = parse_value(value)
-        elif key.startswith("jvm_"):
-            # JVM configuration
-            config["jvm"][key] = parse_value(value)
-        elif key.startswith("agent_"):
-            # Agent configuration
-            config["agent"][key] = parse_value(value)
+        head, sep, _ = key.partition("_")
+        prefix = _PREFIX_MAP.get(head) if sep else None
+        if prefix is not None:
+            section, strip = prefix
+            config[section][key[strip:]] = parse_value(value)
         else:
             # System/other configuration
-            config["system"][key] = parse_value(value)
+            system[key] = parse_value(value)
     
     return config
 
@@ -48,68 +81,69 @@ def parse_value(value: str) -> Any:
     if not isinstance(value, str):
         return value
     
+    first = value[:1]
+    
+    # Size (e.g., "32MiB"), duration (e.g., "10s") and plain numbers all start
+    # with a digit, so only those values go through the numeric parsers
+    if first.isdigit():
+        # Handle numeric values
+        if value.isdigit():
+            return int(value)
+        
+        # Handle float values
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        
+        # Handle size values (e.g., "32MiB", "100KiB")
+        size_match = _SIZE_RE.match(value)
+        if size_match:
+            number = float(size_match.group(1))
+            unit = size_match.group(2)
+            return convert_to_bytes(number, unit)
+        
+        # Handle duration values (e.g., "10s", "5m", "2h")
+        duration_match = _DURATION_RE.match(value)
+        if duration_match:
+            number = float(duration_match.group(1))
+            unit = duration_match.group(2)
+            return convert_to_seconds(number, unit)
+        
+        return value
+    
     # Handle boolean values
-    if value.lower() in ("true", "false"):
-        return value.lower() == "true"
-    
-    # Handle numeric values
-    if value.isdigit():
-        return int(value)
-    
-    # Handle float values
-    try:
-        return float(value)
-    except ValueError:
-        pass
-    
-    # Handle size values (e.g., "32MiB", "100KiB")
-    size_match = re.match(r"^(\d+(?:\.\d+)?)\s*([KMGT]i?B)$", value)
-    if size_match:
-        number = float(size_match.group(1))
-        unit = size_match.group(2)
-        return convert_to_bytes(number, unit)
-    
-    # Handle duration values (e.g., "10s", "5m", "2h")
-    duration_match = re.match(r"^(\d+(?:\.\d+)?)\s*([smhd])$", value)
-    if duration_match:
-        number = float(duration_match.group(1))
-        unit = duration_match.group(2)
-        return convert_to_seconds(number, unit)
+    if len(value) <= 5:
+        boolean = _BOOLEANS.get(value.lower())
+        if boolean is not None:
+            return boolean
     
     # Handle list values
-    if value.startswith("[") and value.endswith("]"):
-        # Simple list parsing
-        items = value[1:-1].split(",")
-        return [item.strip() for item in items if item.strip()]
+    if first == "[":
+        if value.endswith("]"):
+            # Simple list parsing
+            items = value[1:-1].split(",")
+            return [item.strip() for item in items if item.strip()]
+        return value
+    
+    # Handle float values without a leading digit (e.g., "-1", ".5", "inf")
+    if first in _FLOAT_LEAD_CHARS or first.isspace():
+        try:
+            return float(value)
+        except ValueError:
+            pass
     
     return value
 
 
 def convert_to_bytes(value: float, unit: str) -> int:
     """Convert size with unit to bytes"""
-    units = {
-        "B": 1,
-        "KB": 1024,
-        "KiB": 1024,
-        "MB": 1024 * 1024,
-        "MiB": 1024 * 1024,
-        "GB": 1024 * 1024 * 1024,
-        "GiB": 1024 * 1024 * 1024,
-        "TB": 1024 * 1024 * 1024 * 1024,
-        "TiB": 1024 * 1024 * 1024 * 1024,
-    }
-    return int(value * units.get(unit, 1))
+    return int(value * _SIZE_UNITS.get(unit, 1))
 
 
 def convert_to_seconds(value: float, unit: str) -> float:
     """Convert duration with unit to seconds"""
-    units = {
-        "s": 1,
-        "m": 60,
-        "h": 3600,
-        "d": 86400,
-    }
-    return value * units.get(unit, 1)
+    return value * _DURATION_UNITS.get(unit, 1)
 
 
 def extract_cassandra_version(details: Dict[str, Any]) -> Optional[str]:
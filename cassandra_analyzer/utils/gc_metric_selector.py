@@ -42,24 +42,31 @@ class GCMetricSelector:
         }
     }
     
-    @staticmethod
-    def detect_gc_type(jvm_args: str) -> Optional[str]:
+    # Matches every -XX:+Use<collector>GC flag in a single scan of the JVM arguments
+    _GC_FLAG_RE = re.compile(r"-XX:\+Use(G1|ConcMarkSweep|Parallel(?:Old)?|Z|Shenandoah|Serial)GC")
+    
+    # Collector named in the flag -> GC type, in order of precedence when
+    # several collectors are given
+    _GC_FLAG_TYPES = (
+        ('G1', 'G1GC'),
+        ('ConcMarkSweep', 'CMS'),
+        ('Parallel', 'ParallelGC'),
+        ('ParallelOld', 'ParallelGC'),
+        ('Z', 'ZGC'),
+        ('Shenandoah', 'ShenandoahGC'),
+        ('Serial', 'SerialGC'),
+    )
+    
+    @classmethod
+    def detect_gc_type(cls, jvm_args: str) -> Optional[str]:
         """Detect GC type from JVM arguments"""
-        if '-XX:+UseG1GC' in jvm_args:
-            return 'G1GC'
-        elif '-XX:+UseConcMarkSweepGC' in jvm_args:
-            return 'CMS'
-        elif '-XX:+UseParallelGC' in jvm_args or '-XX:+UseParallelOldGC' in jvm_args:
-            return 'ParallelGC'
-        elif '-XX:+UseZGC' in jvm_args:
-            return 'ZGC'
-        elif '-XX:+UseShenandoahGC' in jvm_args:
-            return 'ShenandoahGC'
-        elif '-XX:+UseSerialGC' in jvm_args:
-            return 'SerialGC'
-        else:
-            # Default to G1GC for newer Java versions
-            return 'G1GC'
+        collectors = set(cls._GC_FLAG_RE.findall(jvm_args))
+        if collectors:
+            for collector, gc_type in cls._GC_FLAG_TYPES:
+                if collector in collectors:
+                    return gc_type
+        # Default to G1GC for newer Java versions
+        return 'G1GC'
     
     @classmethod
     def get_gc_metrics(cls, jvm_args: str) -> Dict[str, str]:
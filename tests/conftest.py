@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for Cassandra Analyzer tests
 """
 
+import copy
 import json
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, Mock
@@ -10,11 +11,12 @@ import pytest
 
 from cassandra_analyzer.config import Config
 from cassandra_analyzer.models import ClusterState, MetricData, Node
+from tests.utils import create_cluster_state
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration for testing"""
+@pytest.fixture(scope="session")
+def _mock_config_template():
+    """Build and validate the test configuration once per session"""
     return Config(
         cluster={"org": "test-org", "cluster": "test-cluster", "cluster_type": "cassandra"},
         axonops={
@@ -55,6 +57,20 @@ def mock_config():
     )
 
 
+@pytest.fixture
+def mock_config(_mock_config_template):
+    """Create a mock configuration for testing
+
+    Returns a shallow copy of the session template with its own analysis section,
+    thresholds and enable_sections, so tests can change those without leaking.
+    """
+    config = copy.copy(_mock_config_template)
+    config.analysis = copy.copy(_mock_config_template.analysis)
+    config.analysis.thresholds = copy.copy(_mock_config_template.analysis.thresholds)
+    config.analysis.enable_sections = dict(_mock_config_template.analysis.enable_sections)
+    return config
+
+
 @pytest.fixture
 def mock_axonops_client():
     """Create a mock AxonOps client"""
@@ -113,6 +129,18 @@ def sample_cluster_state():
     return ClusterState(name="test-cluster", cluster_type="cassandra", nodes=nodes_dict)
 
 
+@pytest.fixture(scope="session")
+def base_cluster_state_3():
+    """Build a 3-node cluster state once per session; tests must not modify it"""
+    return create_cluster_state(num_nodes=3)
+
+
+@pytest.fixture
+def cluster_state_3(base_cluster_state_3):
+    """3-node cluster state that a test can modify"""
+    return copy.deepcopy(base_cluster_state_3)
+
+
 @pytest.fixture
 def sample_metrics():
     """Create sample metrics data for testing"""
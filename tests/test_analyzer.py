@@ -2,97 +2,97 @@
 Tests for the main analyzer module
 """
 
+import copy
+from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, NonCallableMock, patch
 
 import pytest
 
 from cassandra_analyzer.analyzer import CassandraAnalyzer
 from cassandra_analyzer.models import Recommendation
 
+# Fixed analysis window so runs are deterministic
+_END_TIME = datetime(2024, 1, 1, 12, 0, 0)
+_START_TIME = _END_TIME - timedelta(hours=24)
+
+# Read-only recommendation returned by the mocked analyzer runs
+_TEST_RECOMMENDATION = Recommendation(
+    category="test",
+    severity="info",
+    title="Test Recommendation",
+    description="This is a test",
+    impact="Low",
+    remediation="No action needed",
+)
+
 
 class TestCassandraAnalyzer:
     """Test cases for CassandraAnalyzer class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def analyzer_params(self):
         """Common parameters for creating analyzer"""
-        from datetime import datetime, timedelta
-
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=24)
-
         return {
             "org": "test-org",
             "cluster_type": "cassandra",
             "cluster": "test-cluster",
-            "start_time": start_time,
-            "end_time": end_time,
+            "start_time": _START_TIME,
+            "end_time": _END_TIME,
             "output_dir": Path("/tmp"),
         }
 
-    def test_analyzer_initialization(self, mock_config):
-        """Test that analyzer initializes correctly with config"""
-        from datetime import datetime, timedelta
-
-        with patch("cassandra_analyzer.analyzer.AxonOpsClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=24)
-
-            analyzer = CassandraAnalyzer(
-                client=mock_client,
-                config=mock_config,
-                org="test-org",
-                cluster_type="cassandra",
-                cluster="test-cluster",
-                start_time=start_time,
-                end_time=end_time,
-                output_dir=Path("/tmp"),
-            )
-
-            assert analyzer.config == mock_config
-            assert analyzer.client == mock_client
-            assert analyzer.collector is not None
-            assert len(analyzer.analyzers) > 0
-
-    @patch("cassandra_analyzer.analyzer.ClusterDataCollector")
-    @patch("cassandra_analyzer.analyzer.AxonOpsClient")
-    def test_analyze_success(
-        self, mock_client_class, mock_collector_class, mock_config, sample_cluster_state, analyzer_params
-    ):
-        """Test successful analysis execution"""
-        # Setup mocks
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
+    @pytest.fixture(scope="module")
+    def analyzer_template(self, _mock_config_template, analyzer_params):
+        """Build one analyzer (collector, analyzer registry, report generator) per module"""
+        # The analyzer only hands the client to the collector; no attributes are used
+        client = NonCallableMock(spec=[])
+        return CassandraAnalyzer(client=client, config=_mock_config_template, **analyzer_params)
 
-        mock_collector = Mock()
-        mock_collector.collect.return_value = sample_cluster_state
-        mock_collector_class.return_value = mock_collector
+    @pytest.fixture
+    def analyzer(self, analyzer_template):
+        """Shallow copy of the template analyzer that a test can patch freely"""
+        analyzer = copy.copy(analyzer_template)
+        analyzer.analyzers = dict(analyzer_template.analyzers)
+        return analyzer
 
-        # Create analyzer
+    @pytest.fixture
+    def patched_client(self, monkeypatch):
+        """Replace AxonOpsClient in the analyzer module with a factory for one Mock"""
+        client = NonCallableMock(spec=[])
+        monkeypatch.setattr("cassandra_analyzer.analyzer.AxonOpsClient", lambda *args, **kwargs: client)
+        return client
+
+    def test_analyzer_initialization(self, mock_config, patched_client):
+        """Test that analyzer initializes correctly with config"""
         analyzer = CassandraAnalyzer(
-            client=mock_client,
+            client=patched_client,
             config=mock_config,
-            **analyzer_params
+            org="test-org",
+            cluster_type="cassandra",
+            cluster="test-cluster",
+            start_time=_START_TIME,
+            end_time=_END_TIME,
+            output_dir=Path("/tmp"),
         )
 
+        assert analyzer.config == mock_config
+        assert analyzer.client == patched_client
+        assert analyzer.collector is not None
+        assert len(analyzer.analyzers) > 0
+
+    def test_analyze_success(self, analyzer, sample_cluster_state):
+        """Test successful analysis execution"""
+        # Setup mocks
+        mock_collector = NonCallableMock(spec=["collect"])
+        mock_collector.collect = Mock(return_value=sample_cluster_state)
+        analyzer.collector = mock_collector
+
         # Mock the _run_analyzers method to return test recommendations
         with patch.object(analyzer, "_run_analyzers") as mock_run_analyzers:
             mock_run_analyzers.return_value = {
                 "infrastructure": {
-                    "recommendations": [
-                        Recommendation(
-                            category="test",
-                            severity="info",
-                            title="Test Recommendation",
-                            description="This is a test",
-                            impact="Low",
-                            remediation="No action needed",
-                        )
-                    ]
+                    "recommendations": [_TEST_RECOMMENDATION]
                 }
             }
 
@@ -103,26 +103,12 @@ class TestCassandraAnalyzer:
         assert isinstance(report_path, Path)
         mock_collector.collect.assert_called_once()
 
-    @patch("cassandra_analyzer.analyzer.ClusterDataCollector")
-    @patch("cassandra_analyzer.analyzer.AxonOpsClient")
-    def test_analyze_with_failed_analyzer(
-        self, mock_client_class, mock_collector_class, mock_config, sample_cluster_state, analyzer_params
-    ):
+    def test_analyze_with_failed_analyzer(self, analyzer, sample_cluster_state):
         """Test analysis continues when individual analyzer fails"""
         # Setup mocks
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-
-        mock_collector = Mock()
-        mock_collector.collect.return_value = sample_cluster_state
-        mock_collector_class.return_value = mock_collector
-
-        # Create analyzer
-        analyzer = CassandraAnalyzer(
-            client=mock_client,
-            config=mock_config,
-            **analyzer_params
-        )
+        mock_collector = NonCallableMock(spec=["collect"])
+        mock_collector.collect = Mock(return_value=sample_cluster_state)
+        analyzer.collector = mock_collector
 
         # Mock the _run_analyzers method to simulate one analyzer failing
         def mock_run_analyzers_with_failure(cluster_state):
@@ -134,16 +120,7 @@ class TestCassandraAnalyzer:
             }
             # Other analyzers succeed
             results["configuration"] = {
-                "recommendations": [
-                    Recommendation(
-                        category="test",
-                        severity="info",
-                        title="Test Recommendation",
-                        description="This is a test",
-                        impact="Low",
-                        remediation="No action needed",
-                    )
-                ]
+                "recommendations": [_TEST_RECOMMENDATION]
             }
             return results
 
@@ -154,51 +131,36 @@ class TestCassandraAnalyzer:
         # Verify
         assert isinstance(report_path, Path)
 
-    def test_generate_report(self, mock_config, sample_cluster_state, analyzer_params):
+    def test_generate_report(self, analyzer, sample_cluster_state):
         """Test report generation"""
-        # Need to create mock client for analyzer
-        with patch("cassandra_analyzer.analyzer.AxonOpsClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-            
-            analyzer = CassandraAnalyzer(
-                client=mock_client,
-                config=mock_config,
-                **analyzer_params
-            )
-
         # Mock the internal methods
-        with patch.object(analyzer, "_collect_data") as mock_collect:
-            with patch.object(analyzer, "_run_analyzers") as mock_run:
-                with patch.object(analyzer, "_generate_report") as mock_generate:
-                    mock_collect.return_value = sample_cluster_state
-                    mock_run.return_value = {"infrastructure": []}
-                    mock_generate.return_value = Path("/tmp/report.md")
-
-                    # Run analysis
-                    report_path = analyzer.analyze()
-
-                    # Verify calls
-                    mock_collect.assert_called_once()
-                    mock_run.assert_called_once_with(sample_cluster_state)
-                    mock_generate.assert_called_once()
-                    assert report_path == Path("/tmp/report.md")
-
-    def test_disabled_analyzers(self, mock_config, analyzer_params):
+        with patch.multiple(
+            analyzer, _collect_data=DEFAULT, _run_analyzers=DEFAULT, _generate_report=DEFAULT
+        ) as mocks:
+            mocks["_collect_data"].return_value = sample_cluster_state
+            mocks["_run_analyzers"].return_value = {"infrastructure": []}
+            mocks["_generate_report"].return_value = Path("/tmp/report.md")
+
+            # Run analysis
+            report_path = analyzer.analyze()
+
+            # Verify calls
+            mocks["_collect_data"].assert_called_once()
+            mocks["_run_analyzers"].assert_called_once_with(sample_cluster_state)
+            mocks["_generate_report"].assert_called_once()
+            assert report_path == Path("/tmp/report.md")
+
+    def test_disabled_analyzers(self, mock_config, analyzer_params, patched_client):
         """Test that disabled analyzers are not included"""
         # Disable some sections
         mock_config.analysis.enable_sections["infrastructure"] = False
         mock_config.analysis.enable_sections["security"] = False
 
-        with patch("cassandra_analyzer.analyzer.AxonOpsClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-            
-            analyzer = CassandraAnalyzer(
-                client=mock_client,
-                config=mock_config,
-                **analyzer_params
-            )
+        analyzer = CassandraAnalyzer(
+            client=patched_client,
+            config=mock_config,
+            **analyzer_params
+        )
 
         # Check that disabled analyzers are not in the list
         analyzer_names = [type(a).__name__ for a in analyzer.analyzers.values()]
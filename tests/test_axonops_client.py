@@ -2,7 +2,10 @@
 Unit tests for the AxonOps API Client
 """
 
-from unittest.mock import MagicMock, Mock, patch
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -16,24 +19,41 @@ from cassandra_analyzer.client.exceptions import (
 )
 
 
+def _make_response(status_code=200, json_data=None, text=None, headers=None):
+    """Build a stub response; text defaults to the JSON encoding of json_data
+
+    Responses are only read by the client, never asserted on, so a plain namespace
+    stands in for a Mock.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={} if headers is None else headers,
+        text=json.dumps(json_data) if text is None else text,
+        json=lambda: json_data,
+        raise_for_status=lambda: None,
+    )
+
+
 class TestAxonOpsClient:
     """Test cases for AxonOpsClient"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def client(self):
-        """Create an AxonOps client instance"""
+        """Create an AxonOps client instance shared by the module's tests"""
         return AxonOpsClient(api_url="http://localhost:9090", token="test-token", timeout=30)
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def mock_request(self):
+        """Patch requests.Session.request for every test and yield the mock"""
+        with patch("requests.Session.request") as mock_request:
+            yield mock_request
+
+    @pytest.fixture(scope="module")
     def mock_response(self):
-        """Create a mock response object"""
-        response = Mock()
-        response.status_code = 200
-        response.json.return_value = {"status": "success"}
-        response.raise_for_status = Mock()
-        response.headers = {"Content-Type": "application/json"}
-        response.text = '{"status": "success"}'
-        return response
+        """Create a mock success response, shared read-only by the module's tests"""
+        return _make_response(
+            json_data={"status": "success"}, headers={"Content-Type": "application/json"}
+        )
 
     def test_client_initialization(self):
         """Test client initialization"""
@@ -56,7 +76,6 @@ class TestAxonOpsClient:
         client2 = AxonOpsClient("http://localhost:9090", "token")
         assert client2.api_url == "http://localhost:9090"
 
-    @patch("requests.Session.request")
     def test_successful_get_request(self, mock_request, client, mock_response):
         """Test successful GET request"""
         mock_request.return_value = mock_response
@@ -67,7 +86,6 @@ class TestAxonOpsClient:
         mock_request.assert_called_once()
         assert mock_request.call_args[1]["url"] == "http://localhost:9090/api/v1/cluster"
 
-    @patch("requests.Session.request")
     def test_successful_post_request(self, mock_request, client, mock_response):
         """Test successful POST request"""
         mock_request.return_value = mock_response
@@ -79,35 +97,41 @@ class TestAxonOpsClient:
         mock_request.assert_called_once()
         assert mock_request.call_args[1]["json"] == data
 
-    @patch("requests.Session.request")
-    def test_authentication_error(self, mock_request, client):
-        """Test authentication error handling"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_response.headers = {}
-        mock_request.return_value = mock_response
-
-        with pytest.raises(AxonOpsAuthError):
+    @pytest.mark.parametrize(
+        "outcome, expected_exception, match",
+        [
+            pytest.param(
+                _make_response(401, text="Unauthorized"), AxonOpsAuthError, None,
+                id="authentication_error",
+            ),
+            pytest.param(Timeout(), AxonOpsConnectionError, None, id="timeout_error"),
+            pytest.param(ConnectionError(), AxonOpsConnectionError, None, id="connection_error"),
+            # Server errors are raised as API errors once HTTPAdapter retries are exhausted
+            pytest.param(
+                _make_response(503, text="Service Unavailable"), AxonOpsAPIError, "API error:",
+                id="max_retries_exceeded",
+            ),
+            pytest.param(
+                _make_response(
+                    400,
+                    json_data={"error": "Invalid parameter", "message": "The cluster name is invalid"},
+                ),
+                AxonOpsAPIError,
+                "API error:",
+                id="error_response_handling",
+            ),
+        ],
+    )
+    def test_request_errors(self, mock_request, client, outcome, expected_exception, match):
+        """Test that failed requests raise the matching client exception"""
+        if isinstance(outcome, Exception):
+            mock_request.side_effect = outcome
+        else:
+            mock_request.return_value = outcome
+
+        with pytest.raises(expected_exception, match=match):
             client._request("GET", "/api/v1/cluster")
 
-    @patch("requests.Session.request")
-    def test_timeout_error(self, mock_request, client):
-        """Test timeout error handling"""
-        mock_request.side_effect = Timeout()
-
-        with pytest.raises(AxonOpsConnectionError):
-            client._request("GET", "/api/v1/cluster")
-
-    @patch("requests.Session.request")
-    def test_connection_error(self, mock_request, client):
-        """Test connection error handling"""
-        mock_request.side_effect = ConnectionError()
-
-        with pytest.raises(AxonOpsConnectionError):
-            client._request("GET", "/api/v1/cluster")
-
-    @patch("requests.Session.request")
     def test_retry_on_server_error(self, mock_request, client, mock_response):
         """Test retry logic on server errors"""
         # The retry is handled by HTTPAdapter, not by our code
@@ -119,30 +143,11 @@ class TestAxonOpsClient:
         assert result == {"status": "success"}
         assert mock_request.call_count == 1
 
-    @patch("requests.Session.request")
-    def test_max_retries_exceeded(self, mock_request, client):
-        """Test that server errors are raised as API errors"""
-        error_response = Mock()
-        error_response.status_code = 503
-        error_response.text = "Service Unavailable"
-        error_response.headers = {}
-
-        mock_request.return_value = error_response
-
-        with pytest.raises(AxonOpsAPIError) as exc_info:
-            client._request("GET", "/api/v1/cluster")
-
-        assert "API error:" in str(exc_info.value)
-
-    @patch("requests.Session.request")
     def test_get_cluster_settings(self, mock_request, client):
         """Test get_cluster_settings method"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"name": "test-cluster", "version": "4.0.11", "nodes": 3}
-        mock_response.text = '{"name": "test-cluster"}'
-        mock_response.headers = {}
-        mock_request.return_value = mock_response
+        mock_request.return_value = _make_response(
+            json_data={"name": "test-cluster", "version": "4.0.11", "nodes": 3}
+        )
 
         result = client.get_cluster_settings("org1", "cassandra", "cluster1")
 
@@ -154,39 +159,30 @@ class TestAxonOpsClient:
         mock_request.assert_called_once()
         assert mock_request.call_args[1]["url"] == expected_url
 
-    @patch("requests.Session.request")
     def test_get_nodes(self, mock_request, client):
         """Test get_nodes method"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"id": "node1", "address": "10.0.0.1"},
-            {"id": "node2", "address": "10.0.0.2"},
-        ]
-        mock_response.text = '[{"id": "node1"}]'
-        mock_response.headers = {}
-        mock_request.return_value = mock_response
+        mock_request.return_value = _make_response(
+            json_data=[
+                {"id": "node1", "address": "10.0.0.1"},
+                {"id": "node2", "address": "10.0.0.2"},
+            ]
+        )
 
         result = client.get_nodes("org1", "cassandra", "cluster1")
 
         assert len(result) == 2
         assert result[0]["id"] == "node1"
 
-    @patch("requests.Session.request")
     def test_query_range(self, mock_request, client):
         """Test query_range method"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "result": [{"metric": {"__name__": "cpu_usage"}, "values": [[1234567890, "50.0"]]}]
+        mock_request.return_value = _make_response(
+            json_data={
+                "data": {
+                    "result": [{"metric": {"__name__": "cpu_usage"}, "values": [[1234567890, "50.0"]]}]
+                }
             }
-        }
-        mock_response.text = '{"data": {}}'
-        mock_response.headers = {}
-        mock_request.return_value = mock_response
+        )
 
-        from datetime import datetime
         result = client.query_range(
             query="cpu_usage",
             start=datetime(2024, 1, 1, 0, 0, 0),
@@ -196,24 +192,6 @@ class TestAxonOpsClient:
         assert "data" in result
         assert len(result["data"]["result"]) == 1
 
-    @patch("requests.Session.request")
-    def test_error_response_handling(self, mock_request, client):
-        """Test handling of error responses with JSON body"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": "Invalid parameter",
-            "message": "The cluster name is invalid",
-        }
-        mock_response.text = '{"error": "Invalid parameter"}'
-        mock_response.headers = {}
-        mock_request.return_value = mock_response
-
-        with pytest.raises(AxonOpsAPIError) as exc_info:
-            client._request("GET", "/api/v1/cluster")
-
-        assert "API error:" in str(exc_info.value)
-
     def test_session_cleanup(self, client):
         """Test that session exists and can be used"""
         # The client doesn't have a close method, so we just verify the session exists
@@ -2,239 +2,189 @@
 Unit tests for the Configuration Analyzer
 """
 
-from unittest.mock import Mock
+import copy
 
 import pytest
 
 from cassandra_analyzer.analyzers.configuration import ConfigurationAnalyzer
-from cassandra_analyzer.models import ClusterState
-from tests.utils import assert_recommendation, create_cluster_state, create_config_value
+from tests.utils import create_cluster_state
+
+_MEM_32GB_STR = str(32 * 1024**3)  # host_virtualmem_Total for a 32GB host
+
+# Node Details shared by several tests; applied with dict.update, never mutated
+_G1_DETAILS = {
+    "comp_jvm_input arguments": "-Xmx8G -XX:+UseG1GC",
+    "host_virtualmem_Total": _MEM_32GB_STR,
+}
+
+_CMS_DETAILS = {
+    "comp_jvm_input arguments": "-Xmx8G -XX:+UseConcMarkSweepGC",
+    "host_virtualmem_Total": _MEM_32GB_STR,
+}
+
+_STREAMING_DETAILS = {
+    "comp_stream_throughput_outbound_megabits_per_sec": "200",
+    "comp_inter_dc_stream_throughput_outbound_megabits_per_sec": "0",
+}
+
+_OPTIMAL_DETAILS = {
+    **_G1_DETAILS,
+    "comp_concurrent_compactors": "4",
+    "host_number_cpu_cores": "16",
+    "comp_memtable_heap_space_in_mb": "2048",
+    "comp_file_cache_size_in_mb": "2048",
+}
+
+
+def _count(result, predicate):
+    """Count the dict recommendations in an analyzer result that satisfy predicate"""
+    return sum(
+        1 for r in result.get("recommendations", ()) if isinstance(r, dict) and predicate(r)
+    )
 
 
 class TestConfigurationAnalyzer:
     """Test cases for ConfigurationAnalyzer"""
 
-    @pytest.fixture
-    def analyzer(self, mock_config):
-        """Create a configuration analyzer instance"""
-        return ConfigurationAnalyzer(mock_config)
+    @pytest.fixture(scope="module")
+    def analyzer(self, _mock_config_template):
+        """Create one configuration analyzer per module; analyze() keeps no state on self"""
+        return ConfigurationAnalyzer(_mock_config_template)
+
+    @pytest.fixture(scope="session")
+    def large_cluster_state_template(self):
+        """Build the 6-node cluster state once; tests get their own deep copy"""
+        return create_cluster_state(num_nodes=6)
 
     @pytest.fixture
-    def mock_collector(self):
-        """Create a mock collector"""
-        return Mock()
-
-    def test_heap_size_configuration(self, analyzer):
-        """Test heap size configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-        
-        # Add JVM configuration to node Details
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_jvm_input arguments"] = "-Xmx4G -XX:+UseG1GC"
-            node.Details["host_virtualmem_Total"] = str(32 * 1024 * 1024 * 1024)  # 32GB
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
-
-        # Should recommend larger heap for 32GB system
-        heap_recs = [r for r in recommendations if "heap" in r.get("title", "").lower()]
-        assert len(heap_recs) > 0
-
-    def test_gc_configuration(self, analyzer):
+    def large_cluster_state(self, large_cluster_state_template):
+        """6-node cluster state that a test can modify"""
+        return copy.deepcopy(large_cluster_state_template)
+
+    @pytest.mark.parametrize(
+        "node_details, predicate",
+        [
+            pytest.param(
+                # Should recommend larger heap for 32GB system
+                [{
+                    "comp_jvm_input arguments": "-Xmx4G -XX:+UseG1GC",
+                    "host_virtualmem_Total": _MEM_32GB_STR,
+                }] * 3,
+                lambda r: "heap" in r.get("title", "").lower(),
+                id="heap_size",
+            ),
+            pytest.param(
+                # The configuration analyzer only checks for mismatches, not optimal values
+                [
+                    {"comp_concurrent_compactors": "1"},
+                    {"comp_concurrent_compactors": "2"},
+                    {"comp_concurrent_compactors": "4"},
+                ],
+                lambda r: "Configuration Mismatch" in r.get("title", "")
+                and "concurrent_compactors" in r.get("title", ""),
+                id="concurrent_compactors",
+            ),
+            pytest.param(
+                # High (>10ms) batch window, passed as int
+                [{"comp_commitlog_sync": "batch", "comp_commitlog_sync_batch_window_in_ms": 50}] * 3,
+                lambda r: "Commitlog Sync Window" in r.get("title", ""),
+                id="commitlog",
+            ),
+            pytest.param(
+                [
+                    {"comp_memtable_allocation_type": "heap_buffers"},
+                    {"comp_memtable_allocation_type": "offheap_objects"},
+                    {"comp_memtable_allocation_type": "heap_buffers"},
+                ],
+                lambda r: "Configuration Mismatch" in r.get("title", "")
+                and "memtable_allocation_type" in r.get("title", ""),
+                id="memtable",
+            ),
+            pytest.param(
+                # Should detect inconsistent heap sizes
+                [
+                    {"comp_jvm_input arguments": "-Xmx8G -XX:+UseG1GC", "comp_concurrent_compactors": "2"},
+                    {"comp_jvm_input arguments": "-Xmx16G -XX:+UseG1GC", "comp_concurrent_compactors": "4"},
+                    {"comp_jvm_input arguments": "-Xmx8G -XX:+UseG1GC", "comp_concurrent_compactors": "2"},
+                ],
+                lambda r: "inconsistent" in r.get("title", "").lower()
+                or "different" in r.get("description", "").lower(),
+                id="inconsistent",
+            ),
+        ],
+    )
+    def test_detects_configuration_issue(self, analyzer, cluster_state_3, node_details, predicate):
+        """Test that per-node Details produce the expected recommendation"""
+        for node, details in zip(cluster_state_3.nodes.values(), node_details):
+            node.Details.update(details)
+
+        result = analyzer.analyze(cluster_state_3)
+
+        assert _count(result, predicate) >= 1
+
+    def test_gc_configuration(self, analyzer, cluster_state_3):
         """Test garbage collector configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add old GC configuration to node Details
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseConcMarkSweepGC"
-            node.Details["host_virtualmem_Total"] = str(32 * 1024 * 1024 * 1024)  # 32GB
+        for node in cluster_state_3.nodes.values():
+            node.Details.update(_CMS_DETAILS)
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
+        result = analyzer.analyze(cluster_state_3)
 
         # Should detect deprecated CMS GC
-        cms_recs = [
-            r for r in recommendations if "CMS" in r.get("title", "") or "Deprecated" in r.get("title", "")
-        ]
-        assert len(cms_recs) > 0
+        def is_cms(r):
+            return "CMS" in r.get("title", "") or "Deprecated" in r.get("title", "")
+
+        assert _count(result, is_cms) > 0
         # Should recommend Shenandoah or G1GC
-        assert any("Shenandoah" in r.get("recommendation", "") for r in cms_recs)
-
-    def test_concurrent_compactors(self, analyzer):
-        """Test concurrent compactors configuration"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add configuration with different concurrent compactors across nodes
-        nodes = list(cluster_state.nodes.values())
-        nodes[0].Details["comp_concurrent_compactors"] = "1"
-        nodes[1].Details["comp_concurrent_compactors"] = "2"
-        nodes[2].Details["comp_concurrent_compactors"] = "4"
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
-
-        # The configuration analyzer only checks for mismatches, not optimal values
-        # Should detect configuration mismatch
-        mismatch_recs = [r for r in recommendations if "Configuration Mismatch" in r.get("title", "") and "concurrent_compactors" in r.get("title", "")]
-        assert len(mismatch_recs) >= 1
-
-    def test_commitlog_configuration(self, analyzer):
-        """Test commitlog configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add configuration with high batch window to node Details
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_commitlog_sync"] = "batch"
-            node.Details["comp_commitlog_sync_batch_window_in_ms"] = 50  # High (>10ms) - pass as int
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
-
-        # Should detect high commitlog sync window
-        commitlog_recs = [r for r in recommendations if "Commitlog Sync Window" in r.get("title", "")]
-        assert len(commitlog_recs) > 0
-
-    def test_memtable_configuration(self, analyzer):
-        """Test memtable configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add configuration with different memtable allocation types
-        nodes = list(cluster_state.nodes.values())
-        nodes[0].Details["comp_memtable_allocation_type"] = "heap_buffers"
-        nodes[1].Details["comp_memtable_allocation_type"] = "offheap_objects"
-        nodes[2].Details["comp_memtable_allocation_type"] = "heap_buffers"
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
-
-        # Should detect configuration mismatch
-        mismatch_recs = [r for r in recommendations if "Configuration Mismatch" in r.get("title", "") and "memtable_allocation_type" in r.get("title", "")]
-        assert len(mismatch_recs) >= 1
-
-    def test_file_cache_configuration(self, analyzer):
-        """Test file cache configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
+        assert _count(result, lambda r: is_cms(r) and "Shenandoah" in r.get("recommendation", "")) > 0
 
+    def test_file_cache_configuration(self, analyzer, cluster_state_3):
+        """Test file cache configuration analysis"""
         # The configuration analyzer doesn't check file cache specifics
         # Just verify analysis completes without error
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseG1GC"
-            node.Details["host_virtualmem_Total"] = str(32 * 1024 * 1024 * 1024)  # 32GB
+        for node in cluster_state_3.nodes.values():
+            node.Details.update(_G1_DETAILS)
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
+        result = analyzer.analyze(cluster_state_3)
 
         # Just verify analysis completes
-        assert isinstance(recommendations, list)
+        assert isinstance(result.get("recommendations", []), list)
 
-    def test_streaming_configuration(self, analyzer):
+    def test_streaming_configuration(self, analyzer, cluster_state_3):
         """Test streaming configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add streaming configuration to node Details
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_stream_throughput_outbound_megabits_per_sec"] = "200"
-            node.Details["comp_inter_dc_stream_throughput_outbound_megabits_per_sec"] = "0"
+        for node in cluster_state_3.nodes.values():
+            node.Details.update(_STREAMING_DETAILS)
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
+        result = analyzer.analyze(cluster_state_3)
 
         # Check for streaming recommendations
-        streaming_recs = [r for r in recommendations if "stream" in r.get("title", "").lower()]
         # May or may not have recommendations depending on defaults
+        _count(result, lambda r: "stream" in r.get("title", "").lower())
 
-    def test_inconsistent_configuration(self, analyzer):
-        """Test detection of inconsistent configuration across nodes"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add inconsistent configurations across nodes
-        nodes = list(cluster_state.nodes.values())
-        nodes[0].Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseG1GC"
-        nodes[0].Details["comp_concurrent_compactors"] = "2"
-        
-        nodes[1].Details["comp_jvm_input arguments"] = "-Xmx16G -XX:+UseG1GC"
-        nodes[1].Details["comp_concurrent_compactors"] = "4"
-        
-        nodes[2].Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseG1GC"
-        nodes[2].Details["comp_concurrent_compactors"] = "2"
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
-
-        # Should detect inconsistent heap sizes
-        inconsistent_recs = [
-            r
-            for r in recommendations
-            if "inconsistent" in r.get("title", "").lower() or "different" in r.get("description", "").lower()
-        ]
-        assert len(inconsistent_recs) > 0
-
-    def test_replication_factor_analysis(self, analyzer):
+    def test_replication_factor_analysis(self, analyzer, large_cluster_state):
         """Test replication factor configuration analysis"""
-        cluster_state = create_cluster_state(num_nodes=6)  # 6 nodes
-
         # The configuration analyzer doesn't analyze replication factors
         # That's handled by the datamodel analyzer
         # Just add JVM config to ensure analysis runs
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseG1GC"
-            node.Details["host_virtualmem_Total"] = str(32 * 1024 * 1024 * 1024)  # 32GB
+        for node in large_cluster_state.nodes.values():
+            node.Details.update(_G1_DETAILS)
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
+        result = analyzer.analyze(large_cluster_state)
 
         # Just verify analysis completes without error
-        assert isinstance(recommendations, list)
+        assert isinstance(result.get("recommendations", []), list)
 
-    def test_optimal_configuration_no_issues(self, analyzer):
+    def test_optimal_configuration_no_issues(self, analyzer, cluster_state_3):
         """Test that optimal configuration produces minimal recommendations"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add optimal configuration to node Details
-        for node_id, node in cluster_state.nodes.items():
-            node.Details["comp_jvm_input arguments"] = "-Xmx8G -XX:+UseG1GC"
-            node.Details["host_virtualmem_Total"] = str(32 * 1024 * 1024 * 1024)  # 32GB
-            node.Details["comp_concurrent_compactors"] = "4"
-            node.Details["host_number_cpu_cores"] = "16"
-            node.Details["comp_memtable_heap_space_in_mb"] = "2048"
-            node.Details["comp_file_cache_size_in_mb"] = "2048"
+        for node in cluster_state_3.nodes.values():
+            node.Details.update(_OPTIMAL_DETAILS)
 
         # Add properly configured keyspaces
-        cluster_state.keyspaces = []
+        cluster_state_3.keyspaces = []
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = [
-            r for r in result.get("recommendations", [])
-            if isinstance(r, dict)
-        ]
+        result = analyzer.analyze(cluster_state_3)
 
         # Should have minimal high severity recommendations
-        high_severity = [r for r in recommendations if r.get("severity", "").upper() in ["HIGH", "CRITICAL"]]
-        assert len(high_severity) == 0
+        assert _count(result, lambda r: r.get("severity", "").upper() in ("HIGH", "CRITICAL")) == 0
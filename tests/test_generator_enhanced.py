@@ -0,0 +1,154 @@
+"""
+Tests for the enhanced markdown report generator
+"""
+
+import pytest
+
+from cassandra_analyzer.models import ClusterState, Node
+from cassandra_analyzer.reports.generator_enhanced import EnhancedReportGenerator
+
+
+def make_node(node_id, dc="dc1", rack="rack1", **details):
+    """Create an active node with the given Details"""
+    details.setdefault("comp_rack", rack)
+    details.setdefault("comp_releaseVersion", "4.0.11")
+    details.setdefault("agent_version", "1.0.0")
+    return Node(host_id=node_id, org="test-org", cluster="test-cluster", DC=dc, Details=details)
+
+
+def make_cluster(*nodes, seeds=None):
+    """Create a cluster state; the seed provider is reported by the first node"""
+    if seeds is not None:
+        nodes[0].Details["comp_seed_provider"] = (
+            "{class_name=org.apache.cassandra.locator.SimpleSeedProvider, "
+            f"parameters=[{{seeds={seeds}}}]}}"
+        )
+    return ClusterState(name="test-cluster", nodes={node.host_id: node for node in nodes})
+
+
+class TestEnhancedReportGenerator:
+    """Test the enhanced report generator helpers"""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        return EnhancedReportGenerator(tmp_path)
+
+    def test_seed_short_hostname_matches_fqdn(self, generator):
+        """Test that a short hostname seed matches a node reporting its FQDN"""
+        cluster = make_cluster(
+            make_node("node1", host_Hostname="cass1.prod.example.com"),
+            make_node("node2", host_Hostname="CASS2.prod.example.com"),
+            make_node("node3", host_Hostname="cass3.prod.example.com"),
+            seeds="cass1:7000, cass2",
+        )
+
+        assert generator._find_seed_node_ids(cluster) == {"node1", "node2"}
+
+    def test_seed_ip_matches_listen_address(self, generator):
+        """Test that an IP seed matches the node's listen address"""
+        cluster = make_cluster(
+            make_node("node1", host_Hostname="cass1", listen_address="10.0.0.1"),
+            make_node("node2", host_Hostname="cass2", comp_listen_address="10.0.0.2"),
+            make_node("node3", host_Hostname="cass3", listen_address="10.0.0.3"),
+            seeds="10.0.0.1:7000,10.0.0.2:7000",
+        )
+
+        assert generator._find_seed_node_ids(cluster) == {"node1", "node2"}
+
+    def test_seed_ip_does_not_match_by_prefix(self, generator):
+        """Test that IP seeds aren't matched on their first octet"""
+        cluster = make_cluster(
+            make_node("node1", host_Hostname="10.0.0.9", listen_address="10.0.0.9"),
+            make_node("node2", host_Hostname="10", listen_address="10.0.0.10"),
+            seeds="10.0.0.1",
+        )
+
+        assert generator._find_seed_node_ids(cluster) == set()
+
+    def test_no_seed_provider(self, generator):
+        """Test that no node is a seed without a seed provider"""
+        cluster = make_cluster(make_node("node1", host_Hostname="cass1"))
+
+        assert generator._find_seed_node_ids(cluster) == set()
+
+    def test_appendix_sorted_by_dc_rack_and_host(self, generator):
+        """Test that appendix rows sort by DC, rack, then case-insensitively by host"""
+        cluster = make_cluster(
+            make_node("node1", dc="dc2", rack="rack1", host_Hostname="alpha"),
+            make_node("node2", dc="dc1", rack="rack2", host_Hostname="alpha"),
+            make_node("node3", dc="dc1", rack="rack1", host_Hostname="Charlie"),
+            make_node("node4", dc="dc1", rack="rack1", host_Hostname="bravo"),
+        )
+
+        rows = generator._prepare_appendix(cluster, {"node4"}).splitlines()
+
+        assert [row.split(" | ")[:3] for row in rows] == [
+            ["| dc1", "rack1", "bravo/node4..."],
+            ["| dc1", "rack1", "Charlie/node3..."],
+            ["| dc1", "rack2", "alpha/node2..."],
+            ["| dc2", "rack1", "alpha/node1..."],
+        ]
+        assert rows[0] == "| dc1 | rack1 | bravo/node4... | 4.0.11 | ✅ Yes | ✅ Active |"
+        assert rows[1].endswith("| ❌ No | ✅ Active |")
+
+    def test_prepare_node_details(self, generator):
+        """Test that affected nodes get their address and current value resolved"""
+        cluster = make_cluster(make_node("node1", host_Hostname="cass1", listen_address="10.0.0.1"))
+        details = {
+            "title": "Low Concurrent Writes",
+            "affected_nodes": [{"node_id": "node1", "details": {"concurrent_writes": 16}}],
+        }
+
+        generator._prepare_node_details({"concurrent_writes": details}, cluster)
+
+        node_info = details["affected_nodes"][0]
+        assert node_info["hostname"] == "cass1"
+        assert node_info["ip"] == "10.0.0.1"
+        assert node_info["current_value_display"] == 16
+
+    def test_prepare_node_details_unknown_node(self, generator):
+        """Test the fallback row for an affected node missing from the cluster"""
+        cluster = make_cluster(make_node("node1", host_Hostname="cass1"))
+        details = {
+            "title": "Sysctl Setting",
+            "affected_nodes": [{"node_id": "0123456789abcdef", "details": {}}],
+        }
+
+        generator._prepare_node_details({"sysctl": details}, cluster)
+
+        node_info = details["affected_nodes"][0]
+        assert node_info["hostname"] == "unknown"
+        assert node_info["ip"] == "01234567..."
+        assert node_info["current_value_display"] == "N/A"
+
+    @pytest.mark.parametrize(
+        "title, node_details, expected",
+        [
+            ("Memtable Settings", {"memtable_flush_writers": 2, "memtable_allocation_type": "heap_buffers"},
+             "heap_buffers"),
+            ("Low Concurrent Reads", {"concurrent_reads": 32, "concurrent_writes": 16}, 32),
+            ("Low Concurrent Writes", {"concurrent_reads": 32, "concurrent_writes": 16}, 16),
+            ("Thread Pool Settings", {"concurrent_reads": 32, "current_value": 8}, 8),
+            ("Sysctl Setting", {"sysctl_value": "0", "current_value": "1"}, "0"),
+            ("Sysctl Setting", {}, "N/A"),
+        ],
+    )
+    def test_resolve_current_value(self, generator, title, node_details, expected):
+        """Test the key priority and title-restricted keys of the current value lookup"""
+        assert generator._resolve_current_value(node_details, title) == expected
+
+    def test_clean_empty_lines_keeps_marked_line_breaks(self, generator):
+        """Test that {{ br }} in the template renders as a two-space line break"""
+        template = generator.env.from_string("**Cluster:** {{ name }}{{ br }}\n**Generated:** today\n")
+
+        content = generator._clean_empty_lines(template.render(name="prod "))
+
+        assert content == "**Cluster:** prod  \n**Generated:** today\n"
+
+    def test_clean_empty_lines_strips_stray_trailing_whitespace(self, generator):
+        """Test that trailing spaces from interpolated values don't become line breaks"""
+        template = generator.env.from_string("**Cluster:** {{ name }}\n**Generated:** today\n   \n\n\n\ntext\t\n")
+
+        content = generator._clean_empty_lines(template.render(name="prod  "))
+
+        assert content == "**Cluster:** prod\n**Generated:** today\n\ntext\n"
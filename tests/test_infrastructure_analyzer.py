@@ -2,47 +2,29 @@
 Unit tests for the Infrastructure Analyzer
 """
 
-from datetime import datetime
-from unittest.mock import Mock
-
 import pytest
 
 from cassandra_analyzer.analyzers.infrastructure import InfrastructureAnalyzer
-from cassandra_analyzer.models import ClusterState, Recommendation
-from tests.utils import (
-    assert_recommendation,
-    create_cluster_state,
-    create_metric_data,
-    create_node_info,
-)
+from tests.utils import create_cluster_state, dict_recommendations
 
 
 class TestInfrastructureAnalyzer:
     """Test cases for InfrastructureAnalyzer"""
 
-    @pytest.fixture
-    def analyzer(self, mock_config):
-        """Create an infrastructure analyzer instance"""
-        return InfrastructureAnalyzer(mock_config)
-
-    @pytest.fixture
-    def mock_collector(self):
-        """Create a mock collector with test data"""
-        collector = Mock()
-        return collector
+    @pytest.fixture(scope="module")
+    def analyzer(self, _mock_config_template):
+        """Create one infrastructure analyzer per module; analyze() keeps no state on self"""
+        return InfrastructureAnalyzer(_mock_config_template)
 
-    def test_high_cpu_usage_detection(self, analyzer):
+    def test_high_cpu_usage_detection(self, analyzer, cluster_state_3):
         """Test detection of high CPU usage"""
-        # Setup test data
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Infrastructure analyzer checks node Details for resource usage, not metrics
         # Let's add high CPU info to node Details
-        for node in cluster_state.nodes.values():
+        for node in cluster_state_3.nodes.values():
             node.Details["host_CPU_Percent"] = "85.0"
 
         # Run analysis
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(cluster_state_3)
         recommendations = result.get("recommendations", [])
 
         # The infrastructure analyzer may not detect CPU usage from metrics
@@ -50,102 +32,87 @@ class TestInfrastructureAnalyzer:
         # For now, verify that analysis completes without error
         assert isinstance(recommendations, list)
 
-    def test_high_memory_usage_detection(self, analyzer):
+    def test_high_memory_usage_detection(self, analyzer, base_cluster_state_3):
         """Test detection of high memory usage"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # The infrastructure analyzer's _analyze_resource_usage method looks for
         # memory_usage_percent in metrics with data_points attribute
         # Since this isn't properly implemented, we just verify analysis completes
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(base_cluster_state_3)
         recommendations = result.get("recommendations", [])
 
         # Just verify that we get a list of recommendations
         assert isinstance(recommendations, list)
 
-    def test_disk_space_warning(self, analyzer):
+    def test_disk_space_warning(self, analyzer, base_cluster_state_3):
         """Test disk space warning detection"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # The infrastructure analyzer looks for disk_usage_percent in metrics
         # with data_points attribute, which isn't properly set up
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(base_cluster_state_3)
         recommendations = result.get("recommendations", [])
 
         # Just verify that we get a list of recommendations
         assert isinstance(recommendations, list)
 
-    def test_heap_usage_analysis(self, analyzer):
+    def test_heap_usage_analysis(self, analyzer, base_cluster_state_3):
         """Test JVM heap usage analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # The infrastructure analyzer doesn't properly check heap usage from metrics
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(base_cluster_state_3)
         recommendations = result.get("recommendations", [])
 
         # Just verify that we get a list of recommendations
         assert isinstance(recommendations, list)
 
-    def test_network_connectivity_issues(self, analyzer):
+    def test_network_connectivity_issues(self, analyzer, base_cluster_state_3):
         """Test detection of network connectivity issues"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # The infrastructure analyzer doesn't check network metrics
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(base_cluster_state_3)
         recommendations = result.get("recommendations", [])
 
         # Just verify that we get a list of recommendations
         assert isinstance(recommendations, list)
 
-    def test_node_down_detection(self, analyzer):
+    def test_node_down_detection(self, analyzer, cluster_state_3):
         """Test detection of down nodes"""
-        # Create cluster with one down node
-        cluster_state = create_cluster_state(num_nodes=3)
-        
         # Mark one node as down by removing its Details
-        nodes = list(cluster_state.nodes.values())
+        nodes = list(cluster_state_3.nodes.values())
         if nodes:
             nodes[0].Details = {}  # Empty details indicate down node
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         down_recs = [
             r
             for r in recommendations
-            if isinstance(r, dict) and ("down" in r.get("title", "").lower() or "inactive" in r.get("title", "").lower())
+            if "down" in r.get("title", "").lower() or "inactive" in r.get("title", "").lower()
         ]
         assert len(down_recs) > 0
         assert down_recs[0].get("severity", "").upper() == "CRITICAL"
 
-    def test_normal_metrics_no_recommendations(self, analyzer):
+    def test_normal_metrics_no_recommendations(self, analyzer, base_cluster_state_3):
         """Test that normal metrics produce no recommendations"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Since resource usage metrics aren't properly checked,
         # we just verify no critical infrastructure issues are found
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(base_cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should have minimal or no high/critical severity recommendations
         # (there might be some about vnodes or other config)
-        high_severity = [r for r in recommendations if isinstance(r, dict) and r.get("severity", "").upper() == "CRITICAL"]
+        high_severity = [r for r in recommendations if r.get("severity", "").upper() == "CRITICAL"]
         # Allow some recommendations but not too many critical ones
         assert len(high_severity) <= 2
 
-    def test_multiple_node_analysis(self, analyzer):
+    def test_multiple_node_analysis(self, analyzer, base_cluster_state_3):
         """Test analysis across multiple nodes"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # The infrastructure analyzer checks various node configurations
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(base_cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should have some recommendations about infrastructure
         assert isinstance(recommendations, list)
         
         # Check if we get any infrastructure-related recommendations
-        infra_recs = [r for r in recommendations if isinstance(r, dict) and r.get("category") == "infrastructure"]
+        infra_recs = [r for r in recommendations if r.get("category") == "infrastructure"]
         # We should get at least some infrastructure recommendations (vnodes, topology, etc)
         assert len(infra_recs) >= 0
 
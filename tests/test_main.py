@@ -0,0 +1,104 @@
+"""
+Tests for the command-line interface
+"""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cassandra_analyzer.__main__ import main
+
+
+class FakePDFGenerator:
+    """Stands in for PDFGenerator; fails on files whose name starts with 'bad'"""
+
+    calls = []
+
+    def generate_pdf(self, markdown_path, pdf_path=None):
+        if markdown_path.name.startswith("bad"):
+            raise ValueError("malformed report")
+        pdf_path = pdf_path or markdown_path.with_suffix(".pdf")
+        self.calls.append((markdown_path, pdf_path))
+        return pdf_path
+
+
+class TestCLI:
+    """Test the cassandra-analyzer command"""
+
+    @pytest.fixture
+    def runner(self):
+        return CliRunner()
+
+    @pytest.fixture
+    def fake_generator(self):
+        FakePDFGenerator.calls = []
+        with patch("cassandra_analyzer.reports.pdf_generator.PDFGenerator", FakePDFGenerator):
+            yield FakePDFGenerator
+
+    def test_missing_config(self, runner):
+        """Test that --config is required without --batch"""
+        result = runner.invoke(main, [])
+
+        assert result.exit_code == 2
+        assert "Missing option '--config'" in result.output
+
+    def test_batch_empty_directory(self, runner, tmp_path):
+        """Test --batch on a directory without markdown reports"""
+        result = runner.invoke(main, ["--batch", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "No markdown reports found" in result.output
+
+    def test_batch_converts_next_to_reports(self, runner, tmp_path, fake_generator):
+        """Test that PDFs are written next to each report by default"""
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "b.md").write_text("# B")
+
+        result = runner.invoke(main, ["--batch", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert [pdf for _, pdf in fake_generator.calls] == [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+
+    def test_batch_honours_output_dir(self, runner, tmp_path, fake_generator):
+        """Test that --output-dir receives the PDFs in batch mode"""
+        (tmp_path / "a.md").write_text("# A")
+        out_dir = tmp_path / "pdfs"
+
+        result = runner.invoke(main, ["--batch", str(tmp_path), "--output-dir", str(out_dir)])
+
+        assert result.exit_code == 0
+        assert out_dir.is_dir()
+        assert fake_generator.calls == [(tmp_path / "a.md", out_dir / "a.pdf")]
+
+    def test_batch_continues_after_failure(self, runner, tmp_path, fake_generator):
+        """Test that one failing report doesn't stop the batch but fails the command"""
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "bad.md").write_text("# Bad")
+        (tmp_path / "c.md").write_text("# C")
+
+        result = runner.invoke(main, ["--batch", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert [md.name for md, _ in fake_generator.calls] == ["a.md", "c.md"]
+        assert "malformed report" in result.output
+        assert "1 of 3 reports could not be converted" in result.output
+
+    def test_batch_missing_dependencies(self, runner, tmp_path):
+        """Test that missing PDF dependencies abort the batch with a clean error"""
+        (tmp_path / "a.md").write_text("# A")
+
+        with patch("cassandra_analyzer.reports.pdf_generator.PDF_AVAILABLE", False):
+            result = runner.invoke(main, ["--batch", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "PDF generation" in result.output
+        assert not isinstance(result.exception, ImportError)
+
+    @pytest.mark.parametrize("extra_args", [["--pdf"], ["--config", __file__]])
+    def test_batch_rejects_analysis_options(self, runner, tmp_path, extra_args):
+        """Test that --batch can't be combined with analysis-only options"""
+        result = runner.invoke(main, ["--batch", str(tmp_path), *extra_args])
+
+        assert result.exit_code == 2
+        assert "--batch cannot be combined" in result.output
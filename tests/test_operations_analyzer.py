@@ -2,210 +2,130 @@
 Unit tests for the Operations Analyzer
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import Mock
-
 import pytest
 
 from cassandra_analyzer.analyzers.operations import OperationsAnalyzer
-from cassandra_analyzer.models import ClusterState, MetricData
-from tests.utils import (
-    assert_recommendation,
-    create_cluster_state,
-    create_compaction_metrics,
-    create_gc_metrics,
-    create_metric_data,
-)
+from tests.utils import MetricPoint, dict_recommendations, with_metric
+
+_HIGH_SEVS = frozenset({"HIGH", "CRITICAL"})
+_NODE_1 = {"host_id": "node-1"}  # Labels shared by every test metric point
 
 
 class TestOperationsAnalyzer:
     """Test cases for OperationsAnalyzer"""
 
-    @pytest.fixture
-    def analyzer(self, mock_config):
-        """Create an operations analyzer instance"""
-        return OperationsAnalyzer(mock_config)
+    @pytest.fixture(scope="module")
+    def analyzer(self, _mock_config_template):
+        """Create one operations analyzer per module; analyze() keeps no state on self"""
+        return OperationsAnalyzer(_mock_config_template)
 
-    @pytest.fixture
-    def mock_collector(self):
-        """Create a mock collector"""
-        return Mock()
-
-    def test_gc_pause_detection(self, analyzer):
+    def test_gc_pause_detection(self, analyzer, base_cluster_state_3):
         """Test detection of long GC pauses"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add GC pause metrics to cluster state
+        # Add GC pause metrics to a copy of the shared cluster state
         # The operations analyzer looks for specific GC metrics
-        cluster_state.metrics["gc_pause_duration_p99"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 1200  # 1200ms pause
-            })()
-        ]
-
-        result = analyzer.analyze(cluster_state)
+        state = with_metric(
+            base_cluster_state_3, "gc_pause_duration_p99", MetricPoint(_NODE_1, 1200)  # 1200ms pause
+        )
+
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer's GC analysis expects metrics with data_points attribute
         # Since our test metrics don't have that structure, just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_pending_compactions(self, analyzer):
+    def test_pending_compactions(self, analyzer, base_cluster_state_3):
         """Test detection of high pending compactions"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add compaction metrics to cluster state
-        cluster_state.metrics["compaction_pending"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 350  # High pending compactions
-            })()
-        ]
+        # Add compaction metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "compaction_pending", MetricPoint(_NODE_1, 350)  # High pending compactions
+        )
 
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer's compaction analysis expects metrics with data_points attribute
         # Since our test metrics don't have that structure, just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_dropped_messages(self, analyzer):
+    def test_dropped_messages(self, analyzer, base_cluster_state_3):
         """Test detection of dropped messages"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add dropped message metrics to cluster state
-        cluster_state.metrics["dropped_mutation"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 5000  # High dropped mutations
-            })()
-        ]
+        # Add dropped message metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "dropped_mutation", MetricPoint(_NODE_1, 5000)  # High dropped mutations
+        )
 
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer's dropped message analysis expects metrics with data_points attribute
         # Since our test metrics don't have that structure, just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_blocked_tasks(self, analyzer):
+    def test_blocked_tasks(self, analyzer, base_cluster_state_3):
         """Test detection of blocked tasks"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add blocked task metrics to cluster state
-        cluster_state.metrics["threadpool_blocked_flush_writer"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 5
-            })()
-        ]
-        cluster_state.metrics["threadpool_blocked_compaction_executor"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 10
-            })()
-        ]
-
-        result = analyzer.analyze(cluster_state)
+        # Add blocked task metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "threadpool_blocked_flush_writer", MetricPoint(_NODE_1, 5)
+        )
+        state = with_metric(
+            state, "threadpool_blocked_compaction_executor", MetricPoint(_NODE_1, 10)
+        )
+
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer's thread pool analysis expects metrics with data_points attribute
         # Since our test metrics don't have that structure, just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_read_latency_analysis(self, analyzer):
+    def test_read_latency_analysis(self, analyzer, base_cluster_state_3):
         """Test read latency analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
+        # Add read latency metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "read_latency_p99", MetricPoint(_NODE_1, 100)  # 100ms p99 latency
+        )
 
-        # Add read latency metrics to cluster state
-        cluster_state.metrics["read_latency_p99"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 100  # 100ms p99 latency
-            })()
-        ]
-
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer might not check latency metrics
         # Just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_write_latency_analysis(self, analyzer):
+    def test_write_latency_analysis(self, analyzer, base_cluster_state_3):
         """Test write latency analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add write latency metrics to cluster state
-        cluster_state.metrics["write_latency_p99"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 50  # 50ms p99 latency
-            })()
-        ]
+        # Add write latency metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "write_latency_p99", MetricPoint(_NODE_1, 50)  # 50ms p99 latency
+        )
 
-        result = analyzer.analyze(cluster_state)
+        result = analyzer.analyze(state)
         recommendations = result.get("recommendations", [])
 
         # The operations analyzer might not check latency metrics
         # Just verify analysis completes
         assert isinstance(recommendations, list)
 
-    def test_repair_status(self, analyzer):
-        """Test repair status analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The operations analyzer doesn't check repair status
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_sstable_count_analysis(self, analyzer):
-        """Test SSTable count analysis"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The operations analyzer doesn't check SSTable count
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_hint_accumulation(self, analyzer):
-        """Test hint accumulation detection"""
-        cluster_state = create_cluster_state(num_nodes=3)
+    @pytest.mark.parametrize("check", ["repair_status", "sstable_count", "hint_accumulation"])
+    def test_unchecked_areas_complete(self, analyzer, base_cluster_state_3, check):
+        """The operations analyzer doesn't check these areas; just verify analysis completes"""
+        result = analyzer.analyze(base_cluster_state_3)
+        assert isinstance(result.get("recommendations", []), list)
 
-        # The operations analyzer doesn't check hints
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_normal_operations_minimal_recommendations(self, analyzer):
+    def test_normal_operations_minimal_recommendations(self, analyzer, base_cluster_state_3):
         """Test that normal operations produce minimal recommendations"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # Add normal operational metrics to cluster state
-        cluster_state.metrics["gc_pause_duration_p99"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 50  # Normal GC pause
-            })()
-        ]
-        cluster_state.metrics["compaction_pending"] = [
-            type('MetricPoint', (), {
-                'labels': {'host_id': 'node-1'},
-                'value': 5  # Low pending
-            })()
-        ]
-
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        # Add normal operational metrics to a copy of the shared cluster state
+        state = with_metric(
+            base_cluster_state_3, "gc_pause_duration_p99", MetricPoint(_NODE_1, 50)  # Normal GC pause
+        )
+        state = with_metric(
+            state, "compaction_pending", MetricPoint(_NODE_1, 5)  # Low pending
+        )
+
+        result = analyzer.analyze(state)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should have minimal high severity recommendations
-        high_severity = [r for r in recommendations if isinstance(r, dict) and r.get("severity", "").upper() in ["HIGH", "CRITICAL"]]
+        high_severity = [r for r in recommendations if r.get("severity", "").upper() in _HIGH_SEVS]
         assert len(high_severity) == 0
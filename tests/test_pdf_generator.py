@@ -6,78 +6,63 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import sys
-import tempfile
 
 from cassandra_analyzer.reports.pdf_generator import PDFGenerator
 
 
+@pytest.fixture(scope="session")
+def sample_md(tmp_path_factory):
+    """One markdown report shared by the tests that never get as far as reading it"""
+    path = tmp_path_factory.mktemp("pdf") / "report.md"
+    path.write_text("# Test Report")
+    return path
+
+
+@pytest.fixture(scope="module")
+def unavailable_generator():
+    """A generator built while the PDF dependencies are reported missing"""
+    with patch("cassandra_analyzer.reports.pdf_generator.PDF_AVAILABLE", False):
+        return PDFGenerator()
+
+
 class TestPDFGenerator:
     """Test PDF generation handling"""
 
-    def test_pdf_generator_init_without_dependencies(self):
+    def test_pdf_generator_init_without_dependencies(self, unavailable_generator):
         """Test PDFGenerator initialization when dependencies are missing"""
-        # Mock the PDF_AVAILABLE as False
-        with patch("cassandra_analyzer.reports.pdf_generator.PDF_AVAILABLE", False):
-            # Should not raise during init
-            generator = PDFGenerator()
-            assert generator.pdf_available is False
-            assert generator.font_config is None
+        # Built with PDF_AVAILABLE patched to False; init must not raise
+        assert unavailable_generator.pdf_available is False
+        assert unavailable_generator.font_config is None
 
     def test_pdf_generator_init_with_dependencies(self):
         """Test PDFGenerator initialization when dependencies are available"""
-        # Check if WeasyPrint is actually available in test environment
-        try:
-            from weasyprint.text.fonts import FontConfiguration
-            # If available, test with real dependencies
-            generator = PDFGenerator()
-            assert hasattr(generator, 'pdf_available')
-            assert hasattr(generator, 'font_config')
-        except ImportError:
-            # If not available, just skip this test
-            pytest.skip("WeasyPrint not installed in test environment")
-
-    def test_generate_pdf_without_dependencies_from_source(self):
+        # Only runs where WeasyPrint is installed; imported when the test runs
+        pytest.importorskip("weasyprint.text.fonts", reason="WeasyPrint not installed in test environment")
+
+        generator = PDFGenerator()
+        assert hasattr(generator, 'pdf_available')
+        assert hasattr(generator, 'font_config')
+
+    def test_generate_pdf_without_dependencies_from_source(self, unavailable_generator, sample_md):
         """Test error when generating PDF without dependencies from source"""
-        with patch("cassandra_analyzer.reports.pdf_generator.PDF_AVAILABLE", False):
-            generator = PDFGenerator()
-            
-            # Create a temporary markdown file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                f.write("# Test Report")
-                temp_path = Path(f.name)
-            
-            try:
-                # Mock sys.frozen to False (running from source)
-                with patch.object(sys, 'frozen', False, create=True):
-                    with pytest.raises(ImportError) as exc_info:
-                        generator.generate_pdf(temp_path)
-                    
-                    assert "PDF generation dependencies not installed" in str(exc_info.value)
-                    assert "pip install weasyprint markdown beautifulsoup4" in str(exc_info.value)
-            finally:
-                temp_path.unlink()
-
-    def test_generate_pdf_without_dependencies_from_executable(self):
+        # Mock sys.frozen to False (running from source)
+        with patch.object(sys, 'frozen', False, create=True):
+            with pytest.raises(ImportError) as exc_info:
+                unavailable_generator.generate_pdf(sample_md)
+
+        assert "PDF generation dependencies not installed" in str(exc_info.value)
+        assert "pip install weasyprint markdown" in str(exc_info.value)
+
+    def test_generate_pdf_without_dependencies_from_executable(self, unavailable_generator, sample_md):
         """Test error when generating PDF from standalone executable"""
-        with patch("cassandra_analyzer.reports.pdf_generator.PDF_AVAILABLE", False):
-            generator = PDFGenerator()
-            
-            # Create a temporary markdown file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                f.write("# Test Report")
-                temp_path = Path(f.name)
-            
-            try:
-                # Mock sys.frozen to True (running from PyInstaller)
-                with patch.object(sys, 'frozen', True, create=True):
-                    with pytest.raises(ImportError) as exc_info:
-                        generator.generate_pdf(temp_path)
-                    
-                    assert "PDF generation is not available in standalone executables" in str(exc_info.value)
-                    assert "use the markdown output" in str(exc_info.value)
-                    assert "github.com/axonops/cassandra-analyzer#pdf-generation" in str(exc_info.value)
-            finally:
-                temp_path.unlink()
+        # Mock sys.frozen to True (running from PyInstaller)
+        with patch.object(sys, 'frozen', True, create=True):
+            with pytest.raises(ImportError) as exc_info:
+                unavailable_generator.generate_pdf(sample_md)
+
+        assert "PDF generation is not available in standalone executables" in str(exc_info.value)
+        assert "use the markdown output" in str(exc_info.value)
+        assert "github.com/axonops/cassandra-analyzer#pdf-generation" in str(exc_info.value)
 
     @pytest.mark.skip(reason="Complex mocking of WeasyPrint dependencies")
     def test_generate_pdf_with_dependencies(self):
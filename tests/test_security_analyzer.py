@@ -2,167 +2,103 @@
 Unit tests for the Security Analyzer
 """
 
-from unittest.mock import Mock
-
 import pytest
 
 from cassandra_analyzer.analyzers.security import SecurityAnalyzer
-from cassandra_analyzer.models import ClusterState
-from tests.utils import assert_recommendation, create_cluster_state, create_config_value
+from tests.utils import dict_recommendations
+
+_HIGH_SEVS = frozenset({"HIGH", "CRITICAL"})
 
 
 class TestSecurityAnalyzer:
     """Test cases for SecurityAnalyzer"""
 
-    @pytest.fixture
-    def analyzer(self, mock_config):
-        """Create a security analyzer instance"""
-        return SecurityAnalyzer(mock_config)
+    @pytest.fixture(scope="module")
+    def analyzer(self, _mock_config_template):
+        """Create one security analyzer per module; analyze() keeps no state on self"""
+        return SecurityAnalyzer(_mock_config_template)
 
-    @pytest.fixture
-    def mock_collector(self):
-        """Create a mock collector"""
-        return Mock()
-
-    def test_authentication_disabled(self, analyzer):
+    def test_authentication_disabled(self, analyzer, cluster_state_3):
         """Test detection of disabled authentication"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add authentication config to node Details
-        for node in cluster_state.nodes.values():
+        for node in cluster_state_3.nodes.values():
             node.Details["comp_authenticator"] = "AllowAllAuthenticator"
             node.Details["comp_authorizer"] = "AllowAllAuthorizer"
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should detect disabled authentication
-        auth_recs = [r for r in recommendations if isinstance(r, dict) and "authentication" in r.get("title", "").lower()]
+        auth_recs = [r for r in recommendations if "authentication" in r.get("title", "").lower()]
         assert len(auth_recs) > 0
         assert any(r.get("severity", "").upper() == "CRITICAL" for r in auth_recs)
 
-    def test_authorization_disabled(self, analyzer):
+    def test_authorization_disabled(self, analyzer, cluster_state_3):
         """Test detection of disabled authorization"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add authorization config to node Details
-        for node in cluster_state.nodes.values():
+        for node in cluster_state_3.nodes.values():
             node.Details["comp_authenticator"] = "PasswordAuthenticator"
             node.Details["comp_authorizer"] = "AllowAllAuthorizer"
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should detect disabled authorization
-        authz_recs = [r for r in recommendations if isinstance(r, dict) and "authorization" in r.get("title", "").lower()]
+        authz_recs = [r for r in recommendations if "authorization" in r.get("title", "").lower()]
         assert len(authz_recs) > 0
         # Check severity - it might be serialized as string or enum
         severities = [r.get("severity") for r in authz_recs]
-        # Accept critical severity in various formats
+        # Accept critical severity in various formats, trying plain equality before str()
         assert any(
-            str(s).upper() == "CRITICAL" or 
-            (hasattr(s, "value") and s.value == "critical") or
-            s == "critical"
+            s == "critical" or
+            getattr(s, "value", None) == "critical" or
+            str(s).upper() == "CRITICAL"
             for s in severities
         )
 
-    def test_encryption_disabled(self, analyzer):
+    def test_encryption_disabled(self, analyzer, cluster_state_3):
         """Test detection of disabled encryption"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add encryption config to node Details
-        for node in cluster_state.nodes.values():
+        for node in cluster_state_3.nodes.values():
             node.Details["comp_internode_encryption"] = "none"
             node.Details["comp_client_encryption_options_enabled"] = "false"
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should detect encryption issues
-        encryption_recs = [r for r in recommendations if isinstance(r, dict) and "encryption" in r.get("title", "").lower()]
+        encryption_recs = [r for r in recommendations if "encryption" in r.get("title", "").lower()]
         # The analyzer might only generate one generic encryption recommendation
         assert len(encryption_recs) >= 1
 
-    def test_weak_cipher_suites(self, analyzer):
-        """Test detection of weak cipher suites"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check cipher suites in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_default_superuser_detection(self, analyzer):
-        """Test detection of default superuser"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check for default superuser in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_audit_logging_disabled(self, analyzer):
-        """Test detection of disabled audit logging"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check audit logging in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_jmx_security(self, analyzer):
-        """Test JMX security configuration"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check JMX security in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_network_interface_binding(self, analyzer):
-        """Test detection of insecure network bindings"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check network bindings in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_role_based_access(self, analyzer):
-        """Test analysis of role-based access control"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
-        # The security analyzer doesn't check roles in the current implementation
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
-
-        # Just verify analysis completes
-        assert isinstance(recommendations, list)
-
-    def test_secure_configuration_minimal_recommendations(self, analyzer):
+    @pytest.mark.parametrize(
+        "check",
+        [
+            "weak_cipher_suites",
+            "default_superuser",
+            "audit_logging",
+            "jmx_security",
+            "network_interface_binding",
+            "role_based_access",
+        ],
+    )
+    def test_unchecked_areas_complete(self, analyzer, base_cluster_state_3, check):
+        """The security analyzer doesn't check these areas; just verify analysis completes"""
+        result = analyzer.analyze(base_cluster_state_3)
+        assert isinstance(result.get("recommendations", []), list)
+
+    def test_secure_configuration_minimal_recommendations(self, analyzer, cluster_state_3):
         """Test that secure configuration produces minimal recommendations"""
-        cluster_state = create_cluster_state(num_nodes=3)
-
         # Add secure configuration to node Details
-        for node in cluster_state.nodes.values():
+        for node in cluster_state_3.nodes.values():
             node.Details["comp_authenticator"] = "PasswordAuthenticator"
             node.Details["comp_authorizer"] = "CassandraAuthorizer"
             node.Details["comp_internode_encryption"] = "all"
             node.Details["comp_client_encryption_options_enabled"] = "true"
 
-        result = analyzer.analyze(cluster_state)
-        recommendations = result.get("recommendations", [])
+        result = analyzer.analyze(cluster_state_3)
+        recommendations = dict_recommendations(result.get("recommendations", []))
 
         # Should have minimal high severity recommendations
-        high_severity = [r for r in recommendations if isinstance(r, dict) and r.get("severity", "").upper() in ["HIGH", "CRITICAL"]]
+        high_severity = [r for r in recommendations if r.get("severity", "").upper() in _HIGH_SEVS]
         assert len(high_severity) == 0
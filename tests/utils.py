@@ -2,12 +2,21 @@
 Test utilities and helper functions
 """
 
-import random
-from datetime import datetime, timedelta
+import copy
+from collections import namedtuple
+from datetime import datetime
 from typing import Any, Dict, List
 
+import numpy as np
+
 from cassandra_analyzer.models import ClusterState, MetricData, Node, Recommendation
 
+# Labelled sample as stored in ClusterState.metrics; analyzers read .labels and .value
+MetricPoint = namedtuple("MetricPoint", ["labels", "value"])
+
+# Seeded PCG64 generator so synthetic metrics are reproducible across runs
+_RNG = np.random.default_rng(0)
+
 
 def create_metric_data(
     metric_name: str,
@@ -18,27 +27,31 @@ def create_metric_data(
     spike_times: List[int] = None,
 ) -> MetricData:
     """Create synthetic metric data for testing"""
-    from cassandra_analyzer.models import MetricPoint
+    from cassandra_analyzer.models import MetricPoint as DataPoint
 
-    now = datetime.now()
-    data_points = []
+    n = hours * 60  # One data point per minute, index i is i minutes ago
 
-    for i in range(hours * 60):  # One data point per minute
-        timestamp = now - timedelta(minutes=i)
+    # Base value with some variance
+    values = base_value + _RNG.uniform(-variance, variance, n)
 
-        # Base value with some variance
-        value = base_value + random.uniform(-variance, variance)
+    # Add spikes at specified times; any iterable of minute indexes works, and
+    # indexes outside the series are ignored
+    if spike_times:
+        spikes = np.fromiter(spike_times, dtype=int)
+        values[spikes[(spikes >= 0) & (spikes < n)]] += 30.0  # Spike value
 
-        # Add spikes at specified times
-        if spike_times and i in spike_times:
-            value += 30.0  # Spike value
-
-        data_points.append(MetricPoint(timestamp=timestamp, value=value))
+    # Walk from the oldest point forward to have chronological order
+    offsets = np.arange(n - 1, -1, -1).astype("timedelta64[m]")
+    timestamps = (np.datetime64(datetime.now(), "us") - offsets).tolist()
+    data_points = [
+        DataPoint(timestamp=timestamp, value=value)
+        for timestamp, value in zip(timestamps, values[::-1].tolist())
+    ]
 
     return MetricData(
         metric_name=metric_name,
         labels={"node": node},
-        data_points=data_points[::-1],  # Reverse to have chronological order
+        data_points=data_points,
     )
 
 
@@ -106,19 +119,31 @@ def create_config_value(
     }
 
 
+# Details shared by every node create_cluster_state builds; copied per node
+_NODE_DETAILS_TEMPLATE = {"comp_rack": "rack1", "state": "NORMAL", "num_tokens": 256}
+
+
 def create_cluster_state(
     num_nodes: int = 3, unhealthy_nodes: int = 0, version: str = "4.0.11"
 ) -> ClusterState:
     """Create a cluster state for testing"""
-    nodes = {}
-    for i in range(1, num_nodes + 1):
-        status = "DN" if i <= unhealthy_nodes else "UN"
-        node = create_node_info(f"node{i}", status=status)
-        nodes[node.host_id] = node
+
+    def make_node(i: int) -> Node:
+        details = _NODE_DETAILS_TEMPLATE.copy()
+        details["status"] = "DN" if i <= unhealthy_nodes else "UN"
+        details["address"] = f"10.0.0.{i}"
+        return Node(host_id=f"node{i}", org="test-org", cluster="test-cluster", DC="dc1", Details=details)
+
+    nodes = {f"node{i}": make_node(i) for i in range(1, num_nodes + 1)}
 
     return ClusterState(name="test-cluster", cluster_type="cassandra", nodes=nodes)
 
 
+def dict_recommendations(recommendations: List[Any]) -> List[Dict[str, Any]]:
+    """Keep the serialized (dict) recommendations so callers can filter without type checks"""
+    return [r for r in recommendations if isinstance(r, dict)]
+
+
 def assert_recommendation(
     recommendation: Recommendation,
     expected_category: str,
@@ -137,42 +162,8 @@ def assert_recommendation(
             ), f"Expected keyword '{keyword}' not found in recommendation"
 
 
-def create_gc_metrics(node: str, pause_times: List[float]) -> Dict[str, MetricData]:
-    """Create GC-related metrics for testing"""
-    now = datetime.now()
-    timestamps = [(now - timedelta(minutes=i)).isoformat() for i in range(len(pause_times), 0, -1)]
-
-    return {
-        "gc_pause_times": MetricData(
-            metric="gc_pause_ms", node=node, timestamps=timestamps, values=pause_times
-        ),
-        "gc_count": MetricData(
-            metric="gc_count",
-            node=node,
-            timestamps=timestamps,
-            values=list(range(len(pause_times))),
-        ),
-    }
-
-
-def create_compaction_metrics(
-    node: str, pending: List[int], completed: List[int]
-) -> Dict[str, MetricData]:
-    """Create compaction-related metrics for testing"""
-    now = datetime.now()
-    timestamps = [(now - timedelta(minutes=i)).isoformat() for i in range(len(pending), 0, -1)]
-
-    return {
-        "pending_compactions": MetricData(
-            metric="pending_compactions",
-            node=node,
-            timestamps=timestamps,
-            values=[float(v) for v in pending],
-        ),
-        "completed_compactions": MetricData(
-            metric="completed_compactions",
-            node=node,
-            timestamps=timestamps,
-            values=[float(v) for v in completed],
-        ),
-    }
+def with_metric(state: ClusterState, key: str, point: Any) -> ClusterState:
+    """Return a shallow copy of state with a one-point metric added; state is left untouched"""
+    new_state = copy.copy(state)
+    new_state.metrics = {**state.metrics, key: [point]}
+    return new_state